@@ -6,7 +6,13 @@ Date: 2025-09-15
 from typing import Final
 
 
-__all__: Final[list[str]] = ["PYDANTIC_AVAILABLE"]
+__all__: Final[list[str]] = [
+    "ISODATE_AVAILABLE",
+    "MSGSPEC_AVAILABLE",
+    "NUMPY_AVAILABLE",
+    "ORJSON_AVAILABLE",
+    "PYDANTIC_AVAILABLE",
+]
 
 
 try:
@@ -15,3 +21,31 @@ try:
     PYDANTIC_AVAILABLE: Final[bool] = True
 except ImportError:
     PYDANTIC_AVAILABLE: Final[bool] = False
+
+try:
+    import isodate
+
+    ISODATE_AVAILABLE: Final[bool] = True
+except ImportError:
+    ISODATE_AVAILABLE: Final[bool] = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE: Final[bool] = True
+except ImportError:
+    MSGSPEC_AVAILABLE: Final[bool] = False
+
+try:
+    import numpy
+
+    NUMPY_AVAILABLE: Final[bool] = True
+except ImportError:
+    NUMPY_AVAILABLE: Final[bool] = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE: Final[bool] = True
+except ImportError:
+    ORJSON_AVAILABLE: Final[bool] = False
@@ -3,19 +3,58 @@ Author: Louis Goodnews
 Date: 2025-09-15
 """
 
+import ast
 import json
+import re
+import sys
 
 from collections import Counter, defaultdict, deque
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 from fractions import Fraction
+from functools import lru_cache
 from frozendict import frozendict
+from os import PathLike
 from pathlib import Path
-from typing import Any, Final, Literal, Mapping, Optional, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+)
 from uuid import UUID
 
+from .constants import (
+    ISODATE_AVAILABLE,
+    MSGSPEC_AVAILABLE,
+    NUMPY_AVAILABLE,
+    ORJSON_AVAILABLE,
+)
 from .exceptions import DataConversionError
 
+# Check if orjson is available
+if ORJSON_AVAILABLE:
+    # Use orjson to decode the JSON documents it decodes like the standard library
+    from orjson import loads as _orjson_loads
+
+# Check if isodate is available
+if ISODATE_AVAILABLE:
+    # Use isodate to parse ISO 8601 durations
+    from isodate import parse_duration
+
+# Check if msgspec is available
+if MSGSPEC_AVAILABLE:
+    import msgspec
+
+# Check if numpy is available
+if NUMPY_AVAILABLE:
+    import numpy as np
+
 
 __all__: Final[list[str]] = [
     "DataConversionUtils",
@@ -23,11 +62,681 @@ __all__: Final[list[str]] = [
 ]
 
 
+# Joins the string representations of the elements of a collection in the "simple" format
+_COMMA_JOIN: Final[Callable[[Iterable[str]], str]] = ", ".join
+
+# Sentinel distinguishing a missing cache entry from a cached None
+_MISSING: Final[object] = object()
+
+# Finds runs of 19 or more digits, which may be integers beyond the 64 bits orjson decodes exactly
+_LONG_DIGITS_SEARCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"[0-9]{19}"
+).search
+
+# Maximum number of strings cached by a single 'deserialize' call
+_DESERIALIZE_CACHE_SIZE: Final[int] = 4096
+
+# Maximum number of results kept by the caches of 'could_be_*' and 'identify_in_str'
+_IDENTIFY_CACHE_SIZE: Final[int] = 8192
+
+# Results of 'could_be_*' checks of immutable values, keyed by the target type, the type of the value and the value
+_COULD_BE_CACHE: Final[dict[tuple[type, type, Any], bool]] = {}
+
+# Maximum length of the strings and bytes whose 'could_be_*' results are cached, so that large values are not kept alive as keys
+_COULD_BE_CACHE_MAX_LENGTH: Final[int] = 256
+
+# Maximum number of bits of the integers whose 'could_be_*' results are cached, for the same reason
+_COULD_BE_CACHE_MAX_BITS: Final[int] = 64
+
+# Types identified by 'identify_in_str', keyed by the string
+_IDENTIFY_CACHE: Final[dict[str, Optional[type]]] = {}
+
+# Maximum number of results kept by the cache of 'is_instance'
+_ISINSTANCE_CACHE_SIZE: Final[int] = 2048
+
+# Results of 'is_instance' checks, keyed by the type of the value and the type checked against
+_ISINSTANCE_CACHE: Final[dict[tuple[type, Any], bool]] = {}
+
+# Instance check of classes whose metaclass does not override it, the only one whose result depends on nothing but the class of the value
+_TYPE_INSTANCECHECK: Final[Callable[[type, Any], bool]] = type.__instancecheck__
+
+# Maximum number of type names kept by the cache of 'identify'
+_TYPE_NAME_CACHE_SIZE: Final[int] = 1024
+
+# Names of the types identified by 'identify', keyed by the type, as '__name__' builds a new string for built-in types
+_TYPE_NAME_CACHE: Final[dict[type, str]] = {}
+
+# Strings encoding each recognized type, passed through the identification and conversion paths by 'warmup'
+_WARMUP_VALUES: Final[tuple[str, ...]] = (
+    "true",
+    "42",
+    "-1.5",
+    "1e3",
+    "3/4",
+    "1+2j",
+    "2020-01-01",
+    "2020-01-01T12:00:00",
+    "12:00:00",
+    "P1DT2H",
+    "01:02:03",
+    "12345678-1234-1234-1234-123456789abc",
+    '{"a": 1}',
+    "[1, 2]",
+    "(1, 2)",
+    "{1, 2}",
+    "text",
+)
+
+# Parses a string with 'datetime.strptime', reusing the result for repeated string and format pairs
+_STRPTIME: Final[Callable[[str, str], datetime]] = lru_cache(maxsize=1024)(
+    datetime.strptime
+)
+
+# Parse strings with their constructors, reusing the results for repeated strings
+_DATETIME_FROMISOFORMAT: Final[Callable[[str], datetime]] = lru_cache(maxsize=2048)(
+    datetime.fromisoformat
+)
+_FLOAT: Final[Callable[[str], float]] = lru_cache(maxsize=2048)(float)
+_INT: Final[Callable[[str], int]] = lru_cache(maxsize=2048)(int)
+_UUID: Final[Callable[[str], UUID]] = lru_cache(maxsize=2048)(UUID)
+
+# Returns the maximum number of digits 'int' converts from a string, 0 meaning no limit, as on Python versions without one
+_INT_MAX_STR_DIGITS: Final[Callable[[], int]] = getattr(
+    sys,
+    "get_int_max_str_digits",
+    lambda: 0,
+)
+
+# Concrete type of the paths created on this platform, as 'Path' itself is never instantiated
+_PATH_TYPE: Final[type] = type(Path())
+
+# Concrete type of the fixed offset timezones, bound once for the exact type dispatch
+_TIMEZONE_TYPE: Final[type] = type(timezone.utc)
+
+# Boolean values keyed by the lowercase strings recognized by 'str_to_bool'
+_STR_TO_BOOL_MAP: Final[dict[str, bool]] = {
+    "true": True,
+    "1": True,
+    "t": True,
+    "y": True,
+    "yes": True,
+    "false": False,
+    "0": False,
+    "f": False,
+    "n": False,
+    "no": False,
+}
+
+# Primitive types recognized by 'is_primitive_type', built once instead of on every call
+_PRIMITIVE_TYPES: Final[tuple[type, ...]] = (
+    int,
+    float,
+    bool,
+)
+
+# Immutable types whose instances can safely be shared between cache hits
+_IMMUTABLE_TYPES: Final[frozenset[type]] = frozenset(
+    {
+        bool,
+        bytes,
+        complex,
+        date,
+        datetime,
+        Decimal,
+        float,
+        Fraction,
+        int,
+        str,
+        time,
+        timedelta,
+        timezone,
+        type(None),
+        UUID,
+    }
+)
+
+# Regular expression sources of the string encodings recognized by 'deserialize', 'str_to_auto' and 'identify_in_str'
+_BOOL_PATTERN: Final[str] = r"(?i:true|false)"
+_INT_PATTERN: Final[str] = r"[-+]?\d+"
+_DECIMAL_PATTERN: Final[str] = (
+    r"[-+]?(?:(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?|\d+[eE][-+]?\d+)"
+)
+_FRACTION_PATTERN: Final[str] = r"[-+]?\d+/\d+"
+_COMPLEX_BODY_PATTERN: Final[str] = (
+    r"[-+]?(?:(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?[-+])?"
+    r"(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?j"
+)
+_COMPLEX_PATTERN: Final[str] = rf"{_COMPLEX_BODY_PATTERN}|\({_COMPLEX_BODY_PATTERN}\)"
+_DATE_PATTERN: Final[str] = r"\d{4}-\d{2}-\d{2}"
+_TIME_PATTERN: Final[str] = (
+    r"\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[-+]\d{2}:?\d{2})?"
+)
+_DATETIME_PATTERN: Final[str] = rf"{_DATE_PATTERN}[T ]{_TIME_PATTERN}"
+_TIMEDELTA_PATTERN: Final[str] = (
+    r"-?P(?=\d|T\d)(?:\d+(?:[.,]\d+)?[YMWD])*(?:T(?:\d+(?:[.,]\d+)?[HMS])+)?"
+)
+_UUID_PATTERN: Final[str] = (
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+# Characters that can start any of the string encodings recognized by 'deserialize' and 'str_to_auto'
+_DESERIALIZE_FIRST_CHARS: Final[frozenset[str]] = frozenset(
+    "+-.(0123456789PTFtfABCDEFabcdef"
+)
+
+# Regular expression source of the integers 'deserialize' restores from JSON strings, only those 'str' turns back into the same string
+_DESERIALIZE_INT_PATTERN: Final[str] = r"0|-?[1-9][0-9]*"
+
+# Single pass classifier of the strings recognized by 'deserialize', each group named after its 'str_to_*' converter
+_DESERIALIZE_RE: Final[re.Pattern[str]] = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})"
+        for (
+            name,
+            pattern,
+        ) in (
+            ("int", _DESERIALIZE_INT_PATTERN),
+            ("decimal", _DECIMAL_PATTERN),
+            ("fraction", _FRACTION_PATTERN),
+            ("complex", _COMPLEX_PATTERN),
+            ("datetime", _DATETIME_PATTERN),
+            ("date", _DATE_PATTERN),
+            ("time", _TIME_PATTERN),
+            ("timedelta", _TIMEDELTA_PATTERN),
+            ("uuid", _UUID_PATTERN),
+        )
+    )
+)
+
+# Single pass classifier of the strings recognized by 'str_to_auto', booleans and every integer spelling included
+_AUTO_RE: Final[re.Pattern[str]] = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})"
+        for (
+            name,
+            pattern,
+        ) in (
+            ("bool", _BOOL_PATTERN),
+            ("int", _INT_PATTERN),
+            ("decimal", _DECIMAL_PATTERN),
+            ("fraction", _FRACTION_PATTERN),
+            ("complex", _COMPLEX_PATTERN),
+            ("datetime", _DATETIME_PATTERN),
+            ("date", _DATE_PATTERN),
+            ("time", _TIME_PATTERN),
+            ("timedelta", _TIMEDELTA_PATTERN),
+            ("uuid", _UUID_PATTERN),
+        )
+    )
+)
+
+# Regular expression source of the floats recognized by 'identify_in_str', infinity and NaN included
+_FLOAT_PATTERN: Final[str] = rf"{_DECIMAL_PATTERN}|[-+]?(?i:inf|infinity|nan)"
+
+# Regular expression source of the booleans recognized by 'identify_in_str', the vocabulary of 'str_to_bool' without the digits
+_IDENTIFY_BOOL_PATTERN: Final[str] = r"(?i:true|false|yes|no|t|f|y|n)"
+
+# Regular expression source of the timedeltas recognized by 'identify_in_str', the 'days,hours:minutes:seconds' format included
+_IDENTIFY_TIMEDELTA_PATTERN: Final[str] = rf"{_TIMEDELTA_PATTERN}|\d+,\d+:\d+:\d+"
+
+# Characters that can start any of the scalar encodings recognized by 'identify_in_str'
+_IDENTIFY_FIRST_CHARS: Final[frozenset[str]] = _DESERIALIZE_FIRST_CHARS | frozenset(
+    "IiNnYy"
+)
+
+# Single pass classifier of the scalar strings recognized by 'identify_in_str', each group named after its 'str_to_*' converter
+_IDENTIFY_RE: Final[re.Pattern[str]] = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})"
+        for (
+            name,
+            pattern,
+        ) in (
+            ("bool", _IDENTIFY_BOOL_PATTERN),
+            ("int", _INT_PATTERN),
+            ("float", _FLOAT_PATTERN),
+            ("complex", _COMPLEX_PATTERN),
+            ("datetime", _DATETIME_PATTERN),
+            ("date", _DATE_PATTERN),
+            ("time", _TIME_PATTERN),
+            ("timedelta", _IDENTIFY_TIMEDELTA_PATTERN),
+            ("uuid", _UUID_PATTERN),
+        )
+    )
+)
+
+# Bound 'fullmatch' of '_IDENTIFY_RE', saving the attribute lookup on every 'identify_in_str' call
+_IDENTIFY_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = (
+    _IDENTIFY_RE.fullmatch
+)
+
+# Matches the integers and the fractions with a non-zero denominator, which the 'Fraction' constructor always accepts
+_FRACTION_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"\s*[-+]?\d+(?:/0*[1-9]\d*)?\s*"
+).fullmatch
+
+# Matches the canonical hyphenated form of a UUID, which the constructor always accepts
+_UUID_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    _UUID_PATTERN
+).fullmatch
+
+# Single pass classifier of the common numeric strings recognized by 'identify_numeric_type', surrounding whitespace included
+_NUMERIC_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    rf"\s*(?:(?P<int>{_INT_PATTERN})|(?P<float>{_FLOAT_PATTERN})|(?P<complex>{_COMPLEX_PATTERN}))\s*"
+).fullmatch
+
+# Numeric types keyed by the names of the groups of '_NUMERIC_MATCH'
+_NUMERIC_DISPATCH: Final[dict[str, type]] = {
+    "complex": complex,
+    "float": float,
+    "int": int,
+}
+
+# Numeric types reported by 'identify_numeric_type', keyed by the exact type of a value that already is a number
+_NUMERIC_TYPES: Final[dict[type, type]] = {
+    bool: int,
+    complex: complex,
+    Decimal: Decimal,
+    float: float,
+    int: int,
+}
+
+# Matches the 'hours:minutes:seconds' format of 'str_to_timedelta', capturing each field
+_HMS_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"(\d+):([0-5]?\d):([0-5]?\d(?:\.\d+)?)"
+).fullmatch
+
+# Matches the 'days,hours:minutes:seconds' fallback format of 'str_to_timedelta', capturing each field
+_DAYS_HMS_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"(\d+),(\d+):(\d+):(\d+)"
+).fullmatch
+
+# Prefilters of the strings 'could_be_*' and 'str_to_*' pass on to the constructors, each accepting a superset of what the constructor accepts
+_COULD_BE_FRACTION_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"[-\s+\d_./eE]+"
+).fullmatch
+_COULD_BE_INT_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"\s*[-+]?\d[\d_]*\s*"
+).fullmatch
+_COULD_BE_FLOAT_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"\s*[-+]?(?:(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][-+]?\d[\d_]*)?"
+    r"|(?i:inf|infinity|nan))\s*"
+).fullmatch
+_COULD_BE_COMPLEX_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"(?i:[-\s()+\d_.ejinfaty]+)"
+).fullmatch
+_COULD_BE_DECIMAL_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"(?i:[-\s+\d_.einfatys]+)"
+).fullmatch
+_COULD_BE_UUID_MATCH: Final[Callable[[str], Optional[re.Match[str]]]] = re.compile(
+    r"[-\s_+{}:0-9A-Fa-fINRUinru]{32,}"
+).fullmatch
+
+
 class DataConversionUtils:
     """
     A collection of utility functions for data conversion.
     """
 
+    @classmethod
+    def _load_json(
+        cls,
+        value: str,
+    ) -> Any:
+        """
+        Decode a JSON document, using orjson where it yields the same result as the standard library.
+
+        orjson turns integers beyond 64 bits into floats and rejects NaN, infinity and lone surrogate
+        escapes, so documents holding long digit runs or that orjson rejects are decoded by 'json.loads'.
+
+        Args:
+            value (str): The JSON document to decode.
+
+        Returns:
+            Any: The decoded JSON document.
+
+        Raises:
+            ValueError: If the JSON document is invalid.
+        """
+
+        # Check if orjson is available and the document is a string without digit runs it could decode lossily
+        if (
+            ORJSON_AVAILABLE
+            and type(value) is str
+            and _LONG_DIGITS_SEARCH(value) is None
+        ):
+            try:
+                # Attempt to decode the document with orjson
+                return _orjson_loads(value)
+            except ValueError:
+                # Fall back to the standard library, which accepts NaN, infinity and lone surrogates
+                pass
+
+        # Decode the document with the standard library
+        return json.loads(value)
+
+    @classmethod
+    def _parse_json(
+        cls,
+        value: str,
+        opener: str,
+        closer: str,
+    ) -> Any:
+        """
+        Parse a string as JSON if it is enclosed in the given brackets.
+
+        Args:
+            value (str): The string to parse.
+            opener (str): The character the string has to start with.
+            closer (str): The character the string has to end with.
+
+        Returns:
+            Any: The parsed JSON document or None if the string is not enclosed in the brackets or cannot be parsed.
+        """
+
+        try:
+            # Check if the string starts with the opener and ends with the closer
+            if len(value) < 2 or value[0] != opener or value[-1] != closer:
+                # Return None if the string does not start with the opener or end with the closer
+                return None
+
+            # Attempt to parse the string as JSON
+            return cls._load_json(value=value)
+        except (AttributeError, TypeError, ValueError):
+            # Return None if neither orjson nor the standard library can parse the string as JSON
+            return None
+
+    @classmethod
+    def _str_to_bool_unchecked(
+        cls,
+        value: str,
+    ) -> Optional[bool]:
+        """
+        Convert a string to a boolean without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            Optional[bool]: The boolean representation of the string or None if the string cannot be converted to a boolean.
+        """
+
+        # Return the boolean the string maps to or None if it maps to none
+        return _STR_TO_BOOL_MAP.get(value.lower())
+
+    @classmethod
+    def _str_to_complex_unchecked(
+        cls,
+        value: str,
+    ) -> Optional[complex]:
+        """
+        Convert a string to a complex number without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            Optional[complex]: The complex number representation of the string or None if the string cannot be converted to a complex number.
+        """
+
+        try:
+            # Attempt to convert the string to a complex number
+            return complex(value)
+        except ValueError:
+            # Return None if the string cannot be converted to a complex number
+            return None
+
+    @classmethod
+    def _str_to_date_unchecked(
+        cls,
+        value: str,
+        format: Optional[str] = None,
+    ) -> Optional[date]:
+        """
+        Convert a string to a date without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+            format (Optional[str]): The format to use. Defaults to None.
+
+        Returns:
+            Optional[date]: The date representation of the string or None if the string cannot be converted to a date.
+        """
+
+        # Check if no format is specified
+        if format is None:
+            try:
+                # Attempt to convert the string to a date using ISO format
+                return date.fromisoformat(value)
+            except ValueError:
+                # Return None if the string cannot be converted to a date
+                return None
+
+        try:
+            # Attempt to convert the string to a date using the specified format
+            return _STRPTIME(value, format).date()
+        except ValueError:
+            # Return None if the string cannot be converted to a date
+            return None
+
+    @classmethod
+    def _str_to_datetime_unchecked(
+        cls,
+        value: str,
+        format: Optional[str] = None,
+    ) -> Optional[datetime]:
+        """
+        Convert a string to a datetime without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+            format (Optional[str]): The format to use. Defaults to None.
+
+        Returns:
+            Optional[datetime]: The datetime representation of the string or None if the string cannot be converted to a datetime.
+        """
+
+        # Check if no format is specified
+        if format is None:
+            try:
+                # Attempt to convert the string to a datetime using ISO format
+                return _DATETIME_FROMISOFORMAT(value)
+            except ValueError:
+                # Return None if the string cannot be converted to a datetime
+                return None
+
+        try:
+            # Attempt to convert the string to a datetime using the specified format
+            return _STRPTIME(value, format)
+        except ValueError:
+            # Return None if the string cannot be converted to a datetime
+            return None
+
+    @classmethod
+    def _str_to_decimal_unchecked(
+        cls,
+        value: str,
+    ) -> Optional[Decimal]:
+        """
+        Convert a string to a decimal without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            Optional[Decimal]: The decimal representation of the string or None if the string cannot be converted to a decimal.
+        """
+
+        try:
+            # Attempt to convert the string to a decimal
+            return Decimal(value)
+        except (ValueError, InvalidOperation):
+            # Return None if the string cannot be converted to a decimal
+            return None
+
+    @classmethod
+    def _str_to_fraction_unchecked(
+        cls,
+        value: str,
+    ) -> Optional[Fraction]:
+        """
+        Convert a string to a fraction without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            Optional[Fraction]: The fraction representation of the string or None if the string cannot be converted to a fraction.
+        """
+
+        try:
+            # Attempt to convert the string to a fraction
+            return Fraction(value)
+        except (ValueError, ZeroDivisionError):
+            # Return None if the string cannot be converted to a fraction or has a zero denominator
+            return None
+
+    @classmethod
+    def _str_to_int_unchecked(
+        cls,
+        value: str,
+    ) -> Optional[int]:
+        """
+        Convert a string to an integer without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            Optional[int]: The integer representation of the string or None if the string cannot be converted to an integer.
+        """
+
+        try:
+            # Attempt to convert the string to an integer
+            return _INT(value)
+        except ValueError:
+            # Return None if the string cannot be converted to an integer
+            return None
+
+    @classmethod
+    def _str_to_time_unchecked(
+        cls,
+        value: str,
+    ) -> Optional[time]:
+        """
+        Convert a string to a time without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            Optional[time]: The time representation of the string or None if the string cannot be converted to a time.
+        """
+
+        try:
+            # Attempt to convert the string to a time using ISO format
+            return time.fromisoformat(value)
+        except ValueError:
+            # Return None if the string cannot be converted to a time
+            return None
+
+    @classmethod
+    def _str_to_timedelta_unchecked(
+        cls,
+        value: str,
+    ) -> Optional[timedelta]:
+        """
+        Convert a string to a timedelta without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            Optional[timedelta]: The timedelta representation of the string or None if the string cannot be converted to a timedelta.
+        """
+
+        # Match the string against the 'hours:minutes:seconds' format in a single pass
+        match: Optional[re.Match[str]] = _HMS_MATCH(value)
+
+        # Check if the string matches the 'hours:minutes:seconds' format
+        if match is not None:
+            # Obtain hours, minutes, and seconds
+            (
+                hours,
+                minutes,
+                seconds,
+            ) = match.groups()
+
+            try:
+                # Attempt to convert the string to a timedelta
+                return timedelta(
+                    hours=int(hours),
+                    minutes=int(minutes),
+                    seconds=float(seconds),
+                )
+            except OverflowError:
+                # Return None if the timedelta is out of range
+                return None
+
+        # Check if isodate is available and the string could be an ISO 8601 duration, which starts with 'P' after an optional sign
+        if ISODATE_AVAILABLE and (value[:1] == "P" or value[1:2] == "P"):
+            try:
+                # Attempt to convert the string to a timedelta using isodate
+                return parse_duration(datestring=value)
+            except (OverflowError, ValueError):
+                # If conversion fails or the duration is out of range, pass and try to convert manually
+                pass
+
+        # Match the string against the 'days,hours:minutes:seconds' format in a single pass
+        match = _DAYS_HMS_MATCH(value)
+
+        # Check if the string does not match the 'days,hours:minutes:seconds' format
+        if match is None:
+            # Return None if the string cannot be converted to a timedelta
+            return None
+
+        # Obtain days, hours, minutes, and seconds
+        (
+            days,
+            hours,
+            minutes,
+            seconds,
+        ) = match.groups()
+
+        try:
+            # Attempt to convert the string to a timedelta
+            return timedelta(
+                days=int(days),
+                hours=int(hours),
+                minutes=int(minutes),
+                seconds=int(seconds),
+            )
+        except OverflowError:
+            # Return None if the timedelta is out of range
+            return None
+
+    @classmethod
+    def _str_to_uuid_unchecked(
+        cls,
+        value: str,
+    ) -> Optional[UUID]:
+        """
+        Convert a string to a UUID without checking that the value is a string.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            Optional[UUID]: The UUID representation of the string or None if the value is not a string.
+        """
+
+        try:
+            # Attempt to convert the string to a UUID
+            return _UUID(value)
+        except ValueError:
+            # Return None if the string is not a valid UUID
+            return None
+
     @classmethod
     def bytes_to_str(
         cls,
@@ -43,7 +752,33 @@ class DataConversionUtils:
             str: The string representation of the bytes.
         """
 
-        return value.decode(encoding="utf-8")
+        # Decode the bytes with the default UTF-8 codec
+        return value.decode()
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """
+        Clear the caches of the results of repeated string conversions and identifications.
+
+        Returns:
+            None
+        """
+
+        # Clear the caches of the cached parsers
+        for cached in (
+            _DATETIME_FROMISOFORMAT,
+            _FLOAT,
+            _INT,
+            _STRPTIME,
+            _UUID,
+        ):
+            cached.cache_clear()
+
+        # Clear the caches of the identification results
+        _COULD_BE_CACHE.clear()
+        _IDENTIFY_CACHE.clear()
+        _ISINSTANCE_CACHE.clear()
+        _TYPE_NAME_CACHE.clear()
 
     @classmethod
     def complex_to_str(
@@ -60,7 +795,7 @@ class DataConversionUtils:
             str: The string representation of the complex number.
         """
 
-        return cls.to_str(value=value)
+        return str(value)
 
     @classmethod
     def convert_to_str(
@@ -79,10 +814,31 @@ class DataConversionUtils:
             str: The string representation of the value.
         """
 
+        # Look up a converter registered for the exact type of the value
+        handler: Optional[Callable[..., Optional[str]]] = _CONVERT_DISPATCH.get(
+            type(value)
+        )
+
+        # Check if a converter is registered for the exact type of the value
+        if handler is not None:
+            # Convert the value to a string
+            return handler(value)
+
+        # Look up a format-aware converter registered for the exact type of the value
+        handler = _CONVERT_FORMAT_DISPATCH.get(type(value))
+
+        # Check if a format-aware converter is registered for the exact type of the value
+        if handler is not None:
+            # Convert the value to a string using the specified format
+            return handler(
+                format=format,
+                value=value,
+            )
+
         # Check if the value is a primitive type
         if DataIdentificationUtils.is_primitive_type(value=value):
             # Convert the value to a string
-            return cls.to_str(value=value)
+            return str(value)
 
         # Check if the value is a date
         elif DataIdentificationUtils.is_date(value=value):
@@ -149,24 +905,29 @@ class DataConversionUtils:
             return cls.uuid_to_str(value=value)
 
         # Default to string conversion
-        return cls.to_str(value=value)
+        return str(value)
 
     @classmethod
     def counter_to_str(
         cls,
         value: Counter,
+        format: Literal["json", "simple"] = "simple",
     ) -> str:
         """
         Convert a counter to a string.
 
         Args:
             value (Counter): The counter to convert.
+            format (Literal["json", "simple"]): The format to use. Defaults to "simple".
 
         Returns:
             str: The string representation of the counter.
         """
 
-        return cls.dict_to_str(value=value)
+        return cls.dict_to_str(
+            format=format,
+            value=value,
+        )
 
     @classmethod
     def date_to_str(
@@ -239,7 +1000,7 @@ class DataConversionUtils:
             str: The string representation of the decimal.
         """
 
-        return cls.to_str(value=value)
+        return str(value)
 
     @classmethod
     def defaultdict_to_str(
@@ -282,7 +1043,7 @@ class DataConversionUtils:
 
         return cls.list_to_str(
             format=format,
-            value=value,
+            value=list(value),
         )
 
     @classmethod
@@ -300,149 +1061,154 @@ class DataConversionUtils:
             Any: The original type of the string.
         """
 
-        def _deserialize(value: Any) -> Any:
-            """ """
+        # Cache of the deserialized strings encountered during this call
+        cache: dict[str, Any] = {}
+
+        # Bind the lookups made for every string to locals of this call
+        cache_get: Callable[[str, Any], Any] = cache.get
+        dispatch: dict[str, Callable[..., Any]] = _DESERIALIZE_DISPATCH
+        first_chars: frozenset[str] = _DESERIALIZE_FIRST_CHARS
+        fullmatch: Callable[[str], Optional[re.Match[str]]] = _DESERIALIZE_RE.fullmatch
+        immutable_types: frozenset[type] = _IMMUTABLE_TYPES
+
+        def _deserialize(value: str) -> Any:
+            """
+            Deserialize a string, classifying it in a single regex pass and reusing the result
+            for strings that were already deserialized.
+
+            Args:
+                value (str): The string to deserialize.
+
+            Returns:
+                Any: The original type of the string or the string itself if it does not encode any recognized type.
+            """
+
+            # Check if the string cannot start any recognized encoding
+            if value[:1] not in first_chars:
+                # Return the string as is without running the classifier
+                return value
+
+            # Look up the result of a previous deserialization of the string
+            result: Any = cache_get(value, _MISSING)
+
+            # Check if the string has already been deserialized
+            if result is not _MISSING:
+                # Return the cached result
+                return result
 
-            # Check if the value is a boolean
-            if DataIdentificationUtils.could_be_bool(value=value):
-                # Return the boolean value
-                return cls.str_to_bool(value=value)
+            # Match the string against the encodings of all recognized types in a single pass
+            match: Optional[re.Match[str]] = fullmatch(value)
 
-            # Check if the value is a complex number
-            elif DataIdentificationUtils.could_be_complex(value=value):
-                # Return the complex value
-                return cls.str_to_complex(value=value)
+            # Check if the string does not encode any recognized type
+            if match is None:
+                # Return the string as is
+                return value
 
-            # Check if the value is a date
-            elif DataIdentificationUtils.could_be_date(value=value):
-                # Return the date value
-                return cls.str_to_date(value=value)
+            # Convert the string with the converter of the matched type
+            result = dispatch[match.lastgroup](value=value)
 
-            # Check if the value is a datetime
-            elif DataIdentificationUtils.could_be_datetime(value=value):
-                # Return the datetime value
-                return cls.str_to_datetime(value=value)
+            # Check if the conversion failed
+            if result is None:
+                # Return the string as is
+                return value
 
-            # Check if the value is a decimal
-            elif DataIdentificationUtils.could_be_decimal(value=value):
-                # Return the decimal value
-                return cls.str_to_decimal(value=value)
+            # Check if the result is safe to share
+            if type(result) in immutable_types:
+                # Clear the cache if it has grown beyond its bound
+                if len(cache) >= _DESERIALIZE_CACHE_SIZE:
+                    cache.clear()
 
-            # Check if the value is a deque
-            elif DataIdentificationUtils.could_be_deque(value=value):
-                # Return the deque value
-                return cls.str_to_deque(value=value)
-
-            # Check if the value is a dictionary
-            elif DataIdentificationUtils.could_be_dict(value=value):
-                # Return the dictionary value
-                return {
-                    key: _deserialize(value=value)
-                    for (
-                        key,
-                        value,
-                    ) in cls.str_to_dict(value=value).items()
-                }
-
-            # Check if the value is a default dictionary
-            elif DataIdentificationUtils.could_be_defaultdict(value=value):
-                # Return the default dictionary value
-                return defaultdict(
-                    _deserialize(value=value), cls.str_to_defaultdict(value=value)
-                )
+                # Cache the result
+                cache[value] = result
 
-            # Check if the value is a fraction
-            elif DataIdentificationUtils.could_be_fraction(value=value):
-                # Return the fraction value
-                return cls.str_to_fraction(value=value)
-
-            # Check if the value is a frozendict
-            elif DataIdentificationUtils.could_be_frozendict(value=value):
-                # Return the frozendict value
-                return frozendict(
-                    {
-                        key: _deserialize(value=value)
-                        for (
-                            key,
-                            value,
-                        ) in cls.str_to_frozendict(value=value).items()
-                    }
-                )
+            # Return the result
+            return result
 
-            # Check if the value is a frozenset
-            elif DataIdentificationUtils.could_be_frozenset(value=value):
-                # Return the frozenset value
-                return frozenset(
-                    _deserialize(value=value)
-                    for value in cls.str_to_frozenset(value=value)
-                )
+        # Convert the string to a JSON object
+        result: Any = cls._load_json(value=value)
+
+        # Check if the result is a string
+        if type(result) is str:
+            # Deserialize the string
+            return _deserialize(value=result)
+
+        # Check if the result is neither a dictionary nor a list
+        if type(result) is not dict and type(result) is not list:
+            # Return the result as is, as JSON already decoded it to its original type
+            return result
+
+        # Containers that still need to be walked, starting with the decoded JSON object
+        stack: list[Union[dict[str, Any], list[Any]]] = [result]
+
+        # Walk the decoded JSON object without recursing, one container at a time
+        while stack:
+            # Obtain the next container to walk
+            container: Union[dict[str, Any], list[Any]] = stack.pop()
+
+            # Walk the items of the container, replacing each string with its deserialized value
+            for (
+                key,
+                item,
+            ) in (
+                container.items() if type(container) is dict else enumerate(container)
+            ):
+                # Obtain the exact type of the item
+                item_type: type = type(item)
 
-            # Check if the value is a set
-            elif DataIdentificationUtils.could_be_set(value=value):
-                # Return the set value
-                return set(
-                    _deserialize(value=value) for value in cls.str_to_set(value=value)
-                )
+                # Check if the item is a string
+                if item_type is str:
+                    # Replace the string with its deserialized value
+                    container[key] = _deserialize(value=item)
 
-            # Check if the value is a time
-            elif DataIdentificationUtils.could_be_time(value=value):
-                # Return the time value
-                return cls.str_to_time(value=value)
+                # Check if the item is a nested container
+                elif item_type is dict or item_type is list:
+                    # Walk the nested container later
+                    stack.append(item)
 
-            # Check if the value is a timedelta
-            elif DataIdentificationUtils.could_be_timedelta(value=value):
-                # Return the timedelta value
-                return cls.str_to_timedelta(value=value)
+        # Return the deserialized JSON object
+        return result
 
-            # Check if the value is a timezone
-            elif DataIdentificationUtils.could_be_timezone(value=value):
-                # Return the timezone value
-                return cls.str_to_timezone(value=value)
+    @classmethod
+    def deserialize_typed(
+        cls,
+        value: Union[bytes, str],
+        schema: Any,
+    ) -> Any:
+        """
+        Deserialize a JSON string directly into the given schema using msgspec.
 
-            # Check if the value is a UUID
-            elif DataIdentificationUtils.could_be_uuid(value=value):
-                # Return the UUID value
-                return cls.str_to_uuid(value=value)
+        Unlike 'deserialize', the types are taken from the schema rather than inferred from the
+        contents of each string, so this is the preferred path when the shape of the data is known.
 
-            # Check if the value is a path
-            elif DataIdentificationUtils.could_be_path(value=value):
-                # Return the path value
-                return cls.str_to_path(value=value)
+        Args:
+            value (Union[bytes, str]): The JSON string to deserialize.
+            schema (Any): The type to decode into (e.g. a msgspec.Struct, a dataclass or list[int]).
 
-            # Check if the value is a counter
-            elif DataIdentificationUtils.could_be_counter(value=value):
-                # Return the counter value
-                return cls.str_to_counter(value=value)
+        Returns:
+            Any: The value decoded into the given schema.
 
-            # Check if the value is a bytes object
-            elif DataIdentificationUtils.could_be_bytes(value=value):
-                # Return the bytes object
-                return cls.str_to_bytes(value=value)
+        Raises:
+            ImportError: If msgspec is not installed.
+            DataConversionError: If the value cannot be decoded into the given schema.
+        """
 
-        # Convert the string to a JSON object
-        result: Union[dict[str, Any], list[Any]] = json.loads(value)
+        # Check if msgspec is available
+        if not MSGSPEC_AVAILABLE:
+            # Raise an ImportError if msgspec is not installed
+            raise ImportError("msgspec is required for typed deserialization")
 
-        # Check if the result is a dictionary
-        if isinstance(
-            result,
-            dict,
-        ):
-            # Deserialize the dictionary
-            return {
-                key: _deserialize(value=value)
-                for (
-                    key,
-                    value,
-                ) in result.items()
-            }
-
-        # Check if the result is a list
-        elif isinstance(
-            result,
-            list,
-        ):
-            # Deserialize the list
-            return [_deserialize(value=value) for value in result]
+        try:
+            # Attempt to decode the value into the given schema
+            return msgspec.json.decode(
+                value,
+                type=schema,
+            )
+        except msgspec.DecodeError as de:
+            # Raise a DataConversionError if the value cannot be decoded into the given schema
+            raise DataConversionError(
+                type_=getattr(schema, "__name__", str(schema)),
+                value=value,
+            ) from de
 
     @classmethod
     def dict_to_str(
@@ -465,8 +1231,8 @@ class DataConversionUtils:
             # Return the string representation of the dictionary in JSON format
             return json.dumps(value)
 
-        # Join the string representation of each element in the dictionary with ", "
-        return ", ".join(map(str, value))
+        # Join the string representation of each key-value pair in the dictionary with ", "
+        return _COMMA_JOIN([f"{key}={item}" for (key, item) in value.items()])
 
     @classmethod
     def frozendict_to_str(
@@ -509,10 +1275,10 @@ class DataConversionUtils:
         # Check if the format is supposed to be JSON
         if format == "json":
             # Return the string representation of the frozenset in JSON format
-            return json.dumps(value)
+            return json.dumps(list(value))
 
         # Join the string representation of each element in the frozenset with ", "
-        return ", ".join(map(str, value))
+        return _COMMA_JOIN([str(element) for element in value])
 
     @classmethod
     def list_to_str(
@@ -537,12 +1303,7 @@ class DataConversionUtils:
             return json.dumps(value)
 
         # Join the string representation of each element in the list with ", "
-        return ", ".join(
-            map(
-                str,
-                value,
-            )
-        )
+        return _COMMA_JOIN([str(element) for element in value])
 
     @classmethod
     def path_to_str(
@@ -559,7 +1320,7 @@ class DataConversionUtils:
             str: The string representation of the path.
         """
 
-        return cls.to_str(value=value)
+        return str(value)
 
     @classmethod
     def set_to_str(
@@ -578,10 +1339,13 @@ class DataConversionUtils:
             str: The string representation of the set.
         """
 
-        return cls.list_to_str(
-            value=list(value),
-            format=format,
-        )
+        # Check if the format is supposed to be JSON
+        if format == "json":
+            # Return the string representation of the set in JSON format
+            return json.dumps(list(value))
+
+        # Join the string representation of each element in the set with ", "
+        return _COMMA_JOIN([str(element) for element in value])
 
     @classmethod
     def serialize(
@@ -598,79 +1362,65 @@ class DataConversionUtils:
             str: The string representation of the value.
         """
 
-        def _serialize(value: Any) -> Any:
+        # Bind the lookups made for every value the JSON encoder cannot encode to locals of this call
+        dispatch: dict[type, Callable[..., Optional[str]]] = _SERIALIZE_DISPATCH
+        mapping_types: frozenset[type] = _SERIALIZE_MAPPING_TYPES
+        sequence_types: frozenset[type] = _SERIALIZE_SEQUENCE_TYPES
+
+        def _serialize_leaf(value: Any) -> Any:
             """
-            Serialize a value to a string.
+            Serialize a value the JSON encoder cannot encode natively.
+
+            The JSON encoder walks dictionaries, lists and tuples and encodes strings, numbers,
+            booleans and None itself, so this is only called for the remaining values.
 
             Args:
                 value (Any): The value to serialize.
 
             Returns:
-                Any: The string representation of the value.
+                Any: A JSON encodable representation of the value.
             """
 
-            # Check if the value is a primitive type
-            if DataIdentificationUtils.is_primitive_type(value=value):
-                # Serialize a primitive type
-                return cls.to_str(value=value)
+            # Obtain the exact type of the value
+            value_type: type = type(value)
 
-            # Check if the value is a dictionary
-            elif DataIdentificationUtils.is_dict(value=value):
-                # Serialize a dictionary
-                return {
-                    key: _serialize(value=item)
-                    for (
-                        key,
-                        item,
-                    ) in value.items()
-                }
+            # Check if the value is exactly one of the supported sequence types
+            if value_type in sequence_types:
+                # Serialize a sequence as a list for the encoder to walk
+                return list(value)
+
+            # Look up a converter registered for the exact type of the value
+            handler: Optional[Callable[..., Optional[str]]] = dispatch.get(value_type)
+
+            # Check if a converter is registered for the exact type of the value
+            if handler is not None:
+                # Serialize a leaf value
+                return handler(value=value)
+
+            # Check if the value is exactly one of the supported mapping types
+            if value_type in mapping_types:
+                # Serialize a mapping as a dictionary for the encoder to walk
+                return dict(value)
 
             # Check if the value is a frozen dictionary
-            elif DataIdentificationUtils.is_frozendict(value=value):
+            if DataIdentificationUtils.is_frozendict(value=value):
                 # Serialize a frozen dictionary
-                return {
-                    key: _serialize(value=item)
-                    for (
-                        key,
-                        item,
-                    ) in value.items()
-                }
-
-            # Check if the value is a list
-            elif DataIdentificationUtils.is_list(value=value):
-                # Serialize a list
-                return [_serialize(item) for item in value]
-
-            # Check if the value is a counter
-            elif DataIdentificationUtils.is_counter(value=value):
-                # Serialize a counter
-                return cls.counter_to_str(value=value)
-
-            # Check if the value is a defaultdict
-            elif DataIdentificationUtils.is_defaultdict(value=value):
-                # Serialize a defaultdict
-                return {
-                    key: _serialize(value=item)
-                    for (
-                        key,
-                        item,
-                    ) in value.items()
-                }
+                return dict(value)
 
             # Check if the value is a deque
             elif DataIdentificationUtils.is_deque(value=value):
                 # Serialize a deque
-                return [_serialize(item) for item in value]
+                return list(value)
 
             # Check if the value is a set
             elif DataIdentificationUtils.is_set(value=value):
                 # Serialize a set
-                return [_serialize(item) for item in value]
+                return list(value)
 
             # Check if the value is a frozenset
             elif DataIdentificationUtils.is_frozenset(value=value):
                 # Serialize a frozenset
-                return [_serialize(item) for item in value]
+                return list(value)
 
             # Check if the value is a datetime
             elif DataIdentificationUtils.is_datetime(value=value):
@@ -712,29 +1462,100 @@ class DataConversionUtils:
                 # Serialize a UUID
                 return cls.uuid_to_str(value=value)
 
-            # Serialize a primitive type
-            return cls.to_str(value=value)
+            # Default to string conversion
+            return str(value)
 
         # Check if the value is a dictionary
         if DataIdentificationUtils.is_dict(value=value):
-            # Serialize a dictionary
+            # Serialize the dictionary in a single pass of the JSON encoder
             return json.dumps(
-                {
-                    key: _serialize(value=item)
-                    for (
-                        key,
-                        item,
-                    ) in value.items()
-                }
+                value,
+                default=_serialize_leaf,
             )
 
         # Check if the value is a list
         elif DataIdentificationUtils.is_list(value=value):
-            # Serialize a list
-            return json.dumps([_serialize(item) for item in value])
+            # Serialize the list in a single pass of the JSON encoder
+            return json.dumps(
+                value,
+                default=_serialize_leaf,
+            )
 
         # Default to string conversion
-        return cls.to_str(value=value)
+        return str(value)
+
+    @classmethod
+    def str_to_auto(
+        cls,
+        value: str,
+    ) -> tuple[type, Any]:
+        """
+        Identify the type encoded in a string and convert the string to it in a single pass.
+
+        The first character selects the candidate container types and other strings are classified by a
+        single regex pass like the one in 'deserialize', so each string is parsed once instead of being
+        probed with a 'could_be_*' check and then converted again with the matching 'str_to_*' method.
+
+        Args:
+            value (str): The string to convert.
+
+        Returns:
+            tuple[type, Any]: The identified type and the converted value, or (str, value) if the string does not encode any recognized type.
+        """
+
+        # Check if the value is not a string
+        if not isinstance(
+            value,
+            str,
+        ):
+            # Return the value as is, as it needs no conversion
+            return (
+                type(value),
+                value,
+            )
+
+        # Obtain the first character of the string
+        first: str = value[:1]
+
+        # Iterate over the container types that can start with the first character of the string
+        for (
+            type_,
+            converter,
+        ) in _CONTAINER_DISPATCH.get(first, ()):
+            # Attempt to convert the string to the container type
+            result: Any = converter(value=value)
+
+            # Check if the string could be converted to the container type
+            if result is not None:
+                # Return the container type and the container
+                return (
+                    type_,
+                    result,
+                )
+
+        # Check if the string could start any of the scalar encodings (a parenthesized complex number included)
+        if first in _DESERIALIZE_FIRST_CHARS:
+            # Match the string against the encodings of all recognized types in a single pass
+            match: Optional[re.Match[str]] = _AUTO_RE.fullmatch(value)
+
+            # Check if the string encodes a recognized type
+            if match is not None:
+                # Convert the string with the converter of the matched type
+                result = _DESERIALIZE_DISPATCH[match.lastgroup](value=value)
+
+                # Check if the conversion succeeded
+                if result is not None:
+                    # Return the type and the converted value
+                    return (
+                        type(result),
+                        result,
+                    )
+
+        # Return the string as is, as it does not encode any recognized type
+        return (
+            str,
+            value,
+        )
 
     @classmethod
     def str_to_bool(
@@ -751,33 +1572,13 @@ class DataConversionUtils:
             Optional[bool]: The boolean representation of the string or None if the string cannot be converted to a boolean.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
+        try:
+            # Attempt to convert the string to a boolean
+            return cls._str_to_bool_unchecked(value=value)
+        except (AttributeError, TypeError):
             # Return None if the value is not a string
             return None
 
-        # Check if the string is in the list of true values
-        if value.lower() in {
-            "true",
-            "1",
-            "t",
-            "y",
-            "yes",
-            "false",
-            "0",
-            "f",
-            "n",
-            "no",
-        }:
-            # Return True if the string is in the list of true values
-            return value.lower() in {"true", "1", "t", "y", "yes"}
-
-        # Return None if the string cannot be converted to a boolean
-        return None
-
     @classmethod
     def str_to_bytes(
         cls,
@@ -793,18 +1594,10 @@ class DataConversionUtils:
             Optional[bytes]: The bytes representation of the string or None if the string cannot be converted to bytes.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
         try:
-            # Attempt to convert the string to bytes
-            return value.encode(encoding="utf-8")
-        except UnicodeEncodeError:
+            # Attempt to convert the string to bytes with the default UTF-8 codec
+            return value.encode()
+        except (AttributeError, UnicodeEncodeError):
             # Return None if the string cannot be converted to bytes
             return None
 
@@ -823,20 +1616,16 @@ class DataConversionUtils:
             Optional[complex]: The complex number representation of the string or None if the string cannot be converted to a complex number.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
+        # Check if the value is a string, as the underlying constructor also accepts numbers
+        if not isinstance(
             value,
             str,
         ):
             # Return None if the value is not a string
             return None
 
-        try:
-            # Attempt to convert the string to a complex number
-            return complex(value)
-        except ValueError:
-            # Return None if the string cannot be converted to a complex number
-            return None
+        # Convert the string to a complex number
+        return cls._str_to_complex_unchecked(value=value)
 
     @classmethod
     def str_to_counter(
@@ -853,8 +1642,8 @@ class DataConversionUtils:
             Optional[Counter]: The counter representation of the string or None if the string cannot be converted to a counter.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
+        # Check if the value is a string, as the underlying constructor also accepts numbers
+        if not isinstance(
             value,
             str,
         ):
@@ -885,28 +1674,14 @@ class DataConversionUtils:
             Optional[date]: The date representation of the string or None if the string cannot be converted to a date.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
-        # Check if no format is specified
-        if format is None:
-            try:
-                # Attempt to convert the string to a date using ISO format
-                return date.fromisoformat(value)
-            except ValueError:
-                # Return None if the string cannot be converted to a date
-                return None
-
         try:
-            # Attempt to convert the string to a date using the specified format
-            return date.strptime(value, format)
-        except ValueError:
-            # Return None if the string cannot be converted to a date
+            # Attempt to convert the string to a date
+            return cls._str_to_date_unchecked(
+                format=format,
+                value=value,
+            )
+        except (AttributeError, TypeError):
+            # Return None if the value is not a string
             return None
 
     @classmethod
@@ -926,28 +1701,14 @@ class DataConversionUtils:
             Optional[datetime]: The datetime representation of the string or None if the string cannot be converted to a datetime.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
-        # Check if no format is specified
-        if format is None:
-            try:
-                # Attempt to convert the string to a datetime using ISO format
-                return datetime.fromisoformat(value)
-            except ValueError:
-                # Return None if the string cannot be converted to a datetime
-                return None
-
         try:
-            # Attempt to convert the string to a datetime using the specified format
-            return datetime.strptime(value, format)
-        except ValueError:
-            # Return None if the string cannot be converted to a datetime
+            # Attempt to convert the string to a datetime
+            return cls._str_to_datetime_unchecked(
+                format=format,
+                value=value,
+            )
+        except (AttributeError, TypeError):
+            # Return None if the value is not a string
             return None
 
     @classmethod
@@ -965,20 +1726,16 @@ class DataConversionUtils:
             Optional[Decimal]: The decimal representation of the string or None if the string cannot be converted to a decimal.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
+        # Check if the value is a string, as the underlying constructor also accepts numbers
+        if not isinstance(
             value,
             str,
         ):
             # Return None if the value is not a string
             return None
 
-        try:
-            # Attempt to convert the string to a decimal
-            return Decimal(value)
-        except (ValueError, InvalidOperation):
-            # Return None if the string cannot be converted to a decimal
-            return None
+        # Convert the string to a decimal
+        return cls._str_to_decimal_unchecked(value=value)
 
     @classmethod
     def str_to_defaultdict(
@@ -995,21 +1752,21 @@ class DataConversionUtils:
             Optional[defaultdict]: The defaultdict representation of the string or None if the string cannot be converted to a defaultdict.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
+        # Parse the string as JSON if it is enclosed in '{' and '}'
+        parsed: Optional[dict[str, Any]] = cls._parse_json(
+            closer="}",
+            opener="{",
+            value=value,
+        )
 
-        try:
-            # Attempt to convert the string to a defaultdict
-            return defaultdict(cls.str_to_dict(value=value))
-        except ValueError:
-            # Return None if the string cannot be converted to a defaultdict
+        # Check if the string cannot be converted to a dictionary
+        if parsed is None:
+            # Return None if the string cannot be converted to a dictionary
             return None
 
+        # Return a defaultdict without a default factory holding the parsed items
+        return defaultdict(None, parsed)
+
     @classmethod
     def str_to_deque(
         cls,
@@ -1025,21 +1782,21 @@ class DataConversionUtils:
             Optional[deque]: The deque representation of the string or None if the string cannot be converted to a deque.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
+        # Parse the string as JSON if it is enclosed in '[' and ']'
+        parsed: Any = cls._parse_json(
+            closer="]",
+            opener="[",
+            value=value,
+        )
 
-        try:
-            # Attempt to convert the string to a deque
-            return deque(cls.str_to_list(value=value))
-        except ValueError:
-            # Return None if the string cannot be converted to a deque
+        # Check if the string cannot be converted to a list
+        if parsed is None:
+            # Return None if the string cannot be converted to a list
             return None
 
+        # Return a deque holding the parsed items
+        return deque(parsed)
+
     @classmethod
     def str_to_dict(
         cls,
@@ -1055,25 +1812,12 @@ class DataConversionUtils:
             Optional[dict[str, Any]]: The dictionary representation of the string or None if the string cannot be converted to a dictionary.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
-        # Check if the string starts with '{' and ends with '}'
-        if not value.startswith("{") or not value.endswith("}"):
-            # Return None if the string does not start with '{' or end with '}'
-            return None
-
-        try:
-            # Attempt to convert the string to a dictionary
-            return json.loads(value)
-        except (ValueError, TypeError):
-            # Return None if the string cannot be converted to a dictionary
-            return None
+        # Parse the string as JSON if it is enclosed in '{' and '}'
+        return cls._parse_json(
+            closer="}",
+            opener="{",
+            value=value,
+        )
 
     @classmethod
     def str_to_float(
@@ -1090,8 +1834,8 @@ class DataConversionUtils:
             Optional[float]: The float representation of the string or None if the string cannot be converted to a float.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
+        # Check if the value is a string, as the underlying constructor also accepts numbers
+        if not isinstance(
             value,
             str,
         ):
@@ -1100,11 +1844,99 @@ class DataConversionUtils:
 
         try:
             # Attempt to convert the string to a float
-            return float(value)
+            return _FLOAT(value)
         except ValueError:
             # Return None if the string cannot be converted to a float
             return None
 
+    @classmethod
+    def str_to_float_array(
+        cls,
+        values: Iterable[str],
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Convert strings to a NumPy array of floats, converting all of them in a single pass where possible.
+
+        Args:
+            values (Iterable[str]): The strings to convert.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The float64 array of the converted strings (NaN where a string cannot be converted to a float) and a boolean mask that is True where the string could be converted.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+
+        # Check if numpy is available
+        if not NUMPY_AVAILABLE:
+            # Raise an ImportError if numpy is not installed
+            raise ImportError("numpy is required for array conversion")
+
+        # Collect the strings, as they are traversed more than once
+        strings: list[str] = list(values)
+
+        # Check if all values are strings without NUL characters, as numpy converts other values from their text and strips trailing NUL characters
+        if all(type(string) is str for string in strings) and "\x00" not in "".join(
+            strings
+        ):
+            try:
+                # Attempt to convert all strings at once inside numpy
+                return (
+                    np.array(
+                        strings,
+                        dtype=np.str_,
+                    ).astype(np.float64),
+                    np.ones(
+                        len(strings),
+                        dtype=np.bool_,
+                    ),
+                )
+            except (OverflowError, ValueError):
+                # Fall back to converting the strings one by one if any of them cannot be converted
+                pass
+
+        # Array of the converted strings, holding NaN for the strings that cannot be converted
+        result: np.ndarray = np.full(
+            len(strings),
+            np.nan,
+            dtype=np.float64,
+        )
+
+        # Mask of the strings that could be converted
+        mask: np.ndarray = np.zeros(
+            len(strings),
+            dtype=np.bool_,
+        )
+
+        # Iterate over the strings and their indices
+        for (
+            index,
+            string,
+        ) in enumerate(strings):
+            # Convert the string to a float
+            converted: Optional[float] = cls.str_to_float(value=string)
+
+            # Check if the string cannot be converted to a float
+            if converted is None:
+                # Skip the string, leaving it unmarked in the mask
+                continue
+
+            try:
+                # Attempt to store the converted string
+                result[index] = converted
+            except OverflowError:
+                # Skip the string if its value does not fit into the array
+                continue
+
+            # Mark the string as converted
+            mask[index] = True
+
+        # Return the array of the converted strings and the mask
+        return (
+            result,
+            mask,
+        )
+
     @classmethod
     def str_to_fraction(
         cls,
@@ -1120,21 +1952,22 @@ class DataConversionUtils:
             Optional[Fraction]: The fraction representation of the string or None if the string cannot be converted to a fraction.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
+        # Check if the value is a string, as the underlying constructor also accepts numbers
+        if not isinstance(
             value,
             str,
         ):
             # Return None if the value is not a string
             return None
 
-        try:
-            # Attempt to convert the string to a fraction
-            return Fraction(value)
-        except ValueError:
-            # Return None if the string cannot be converted to a fraction
+        # Check if the string cannot spell a fraction at all
+        if _COULD_BE_FRACTION_MATCH(value) is None:
+            # Return None without raising and catching an exception
             return None
 
+        # Convert the string to a fraction
+        return cls._str_to_fraction_unchecked(value=value)
+
     @classmethod
     def str_to_frozendict(
         cls,
@@ -1150,21 +1983,21 @@ class DataConversionUtils:
             Optional[frozendict]: The frozen dictionary representation of the string or None if the string cannot be converted to a frozen dictionary.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
+        # Parse the string as JSON if it is enclosed in '{' and '}'
+        parsed: Any = cls._parse_json(
+            closer="}",
+            opener="{",
+            value=value,
+        )
 
-        try:
-            # Attempt to convert the string to a frozen dictionary
-            return frozendict(cls.str_to_dict(value=value))
-        except (ValueError, TypeError):
-            # Return None if the string cannot be converted to a frozen dictionary
+        # Check if the string cannot be converted to a dictionary
+        if parsed is None:
+            # Return None if the string cannot be converted to a dictionary
             return None
 
+        # Return a frozen dictionary holding the parsed items
+        return frozendict(parsed)
+
     @classmethod
     def str_to_frozenset(
         cls,
@@ -1180,19 +2013,23 @@ class DataConversionUtils:
             Optional[frozenset]: The frozenset representation of the string or None if the string cannot be converted to a frozenset.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
+        # Parse the string as JSON if it is enclosed in '[' and ']'
+        parsed: Any = cls._parse_json(
+            closer="]",
+            opener="[",
+            value=value,
+        )
+
+        # Check if the string cannot be converted to a list
+        if parsed is None:
+            # Return None if the string cannot be converted to a list
             return None
 
         try:
-            # Attempt to convert the string to a frozenset
-            return frozenset(cls.str_to_list(value=value))
-        except (ValueError, TypeError):
-            # Return None if the string cannot be converted to a frozenset
+            # Attempt to convert the list to a frozenset
+            return frozenset(parsed)
+        except TypeError:
+            # Return None if the list holds unhashable elements
             return None
 
     @classmethod
@@ -1210,21 +2047,119 @@ class DataConversionUtils:
             Optional[int]: The integer representation of the string or None if the string cannot be converted to an integer.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
+        # Check if the value is a string, as the underlying constructor also accepts numbers
+        if not isinstance(
             value,
             str,
         ):
             # Return None if the value is not a string
             return None
 
-        try:
-            # Attempt to convert the string to an integer
-            return int(value)
-        except ValueError:
-            # Return None if the string cannot be converted to an integer
+        # Check if the string consists of digits only, which 'int' accepts below its digit limit
+        if value.isdigit() and value.isascii():
+            try:
+                # Convert the string to an integer without the prefilter of the general path
+                return _INT(value)
+            except ValueError:
+                # Return None if the string exceeds the digit limit of 'int'
+                return None
+
+        # Check if the string cannot spell an integer at all
+        if _COULD_BE_INT_MATCH(value) is None:
+            # Return None without raising and catching an exception
             return None
 
+        # Convert the string to an integer
+        return cls._str_to_int_unchecked(value=value)
+
+    @classmethod
+    def str_to_int_array(
+        cls,
+        values: Iterable[str],
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Convert strings to a NumPy array of integers, converting all of them in a single pass where possible.
+
+        Args:
+            values (Iterable[str]): The strings to convert.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The int64 array of the converted strings (0 where a string cannot be converted to an integer) and a boolean mask that is True where the string could be converted.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+
+        # Check if numpy is available
+        if not NUMPY_AVAILABLE:
+            # Raise an ImportError if numpy is not installed
+            raise ImportError("numpy is required for array conversion")
+
+        # Collect the strings, as they are traversed more than once
+        strings: list[str] = list(values)
+
+        # Check if all values are strings without NUL characters, as numpy converts other values from their text and strips trailing NUL characters
+        if all(type(string) is str for string in strings) and "\x00" not in "".join(
+            strings
+        ):
+            try:
+                # Attempt to convert all strings at once inside numpy
+                return (
+                    np.array(
+                        strings,
+                        dtype=np.str_,
+                    ).astype(np.int64),
+                    np.ones(
+                        len(strings),
+                        dtype=np.bool_,
+                    ),
+                )
+            except (OverflowError, ValueError):
+                # Fall back to converting the strings one by one if any of them cannot be converted
+                pass
+
+        # Array of the converted strings, holding 0 for the strings that cannot be converted
+        result: np.ndarray = np.full(
+            len(strings),
+            0,
+            dtype=np.int64,
+        )
+
+        # Mask of the strings that could be converted
+        mask: np.ndarray = np.zeros(
+            len(strings),
+            dtype=np.bool_,
+        )
+
+        # Iterate over the strings and their indices
+        for (
+            index,
+            string,
+        ) in enumerate(strings):
+            # Convert the string to an integer
+            converted: Optional[int] = cls.str_to_int(value=string)
+
+            # Check if the string cannot be converted to an integer
+            if converted is None:
+                # Skip the string, leaving it unmarked in the mask
+                continue
+
+            try:
+                # Attempt to store the converted string
+                result[index] = converted
+            except OverflowError:
+                # Skip the string if its value does not fit into the array
+                continue
+
+            # Mark the string as converted
+            mask[index] = True
+
+        # Return the array of the converted strings and the mask
+        return (
+            result,
+            mask,
+        )
+
     @classmethod
     def str_to_list(
         cls,
@@ -1240,62 +2175,45 @@ class DataConversionUtils:
             Optional[list]: The list representation of the string or None if the string cannot be converted to a list.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
-        # Check if the string starts with '[' and ends with ']'
-        if not value.startswith("[") or not value.endswith("]"):
-            # Return None if the string does not start with '[' or end with ']'
-            return None
-
-        try:
-            # Attempt to convert the string to a list
-            return json.loads(value)
-        except (ValueError, TypeError):
-            # Return None if the string cannot be converted to a list
-            return None
+        # Parse the string as JSON if it is enclosed in '[' and ']'
+        return cls._parse_json(
+            closer="]",
+            opener="[",
+            value=value,
+        )
 
     @classmethod
     def str_to_path(
         cls,
         value: str,
+        check_exists: bool = False,
     ) -> Optional[Path]:
         """
         Convert a string to a path.
 
         Args:
             value (str): The string to convert.
+            check_exists (bool): Whether to return None if the path does not exist. Defaults to False.
 
         Returns:
-            Optional[Path]: The path representation of the string or None if the value is not a string.
+            Optional[Path]: The path representation of the string or None if the value is not a string (or the path does not exist when check_exists is True).
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
+        try:
+            # Attempt to convert the string to a path
+            path: Path = Path(value)
+        except TypeError:
             # Return None if the value is not a string
             return None
 
-        # Convert the string to a path
-        path: Path = Path(value)
-
-        try:
-            # Attempt to resolve the path
-            path.resolve()
-
-            # Return the path if resolving it succeeds
-            return path
-        except FileNotFoundError:
+        # Check if the path is required to exist but does not
+        if check_exists and not path.exists():
             # Return None if the path does not exist
             return None
 
+        # Return the path
+        return path
+
     @classmethod
     def str_to_set(
         cls,
@@ -1311,34 +2229,29 @@ class DataConversionUtils:
              Optional[Set]: The set representation of the string or None if the string cannot be converted to a set.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
+        try:
+            # Check if the string starts with '{' and ends with '}'
+            if len(value) < 2 or value[0] != "{" or value[-1] != "}":
+                # Return None if the string cannot be converted to a set
+                return None
+        except (AttributeError, TypeError):
             # Return None if the value is not a string
             return None
 
-        # Check if the string starts with '{' and ends with '}'
-        if not value.startswith("{") or not value.endswith("}"):
-            # Return None if the string cannot be converted to a set
-            return None
-
-        # Check if the string could be split by ':' (potentially being a dictionary)
-        if ":" in value:
-            # Return None if the string cannot be converted to a set
+        try:
+            # Attempt to parse the string as a Python literal
+            parsed: Any = ast.literal_eval(value)
+        except (MemoryError, RecursionError, SyntaxError, TypeError, ValueError):
+            # Return None if the string is not a valid Python literal
             return None
 
-        # Attempt to split the string by ','
-        parts = value[1:-1].split(",")
-
-        # Check if the string could not be split by ','
-        if not parts:
+        # Check if the string is not a set literal (e.g. a dictionary or a parenthesized scalar)
+        if type(parsed) is not set:
             # Return None if the string cannot be converted to a set
             return None
 
-        # Return the set of parts
-        return set(parts)
+        # Return the set
+        return parsed
 
     @classmethod
     def str_to_time(
@@ -1355,19 +2268,11 @@ class DataConversionUtils:
             Optional[time]: The time representation of the string or None if the string cannot be converted to a time.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
         try:
-            # Attempt to convert the string to a time using ISO format
-            return time.fromisoformat(value)
-        except ValueError:
-            # Return None if the string cannot be converted to a time
+            # Attempt to convert the string to a time
+            return cls._str_to_time_unchecked(value=value)
+        except (AttributeError, TypeError):
+            # Return None if the value is not a string
             return None
 
     @classmethod
@@ -1385,59 +2290,11 @@ class DataConversionUtils:
             Optional[timedelta]: The timedelta representation of the string or None if the string cannot be converted to a timedelta.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
-        # Import the parse_duration function from isodate locally
-        from isodate import parse_duration
-
-        try:
-            # Attempt to convert the string to a timedelta using isodate
-            return parse_duration(datestring=value)
-        except ValueError:
-            # If conversion fails, pass and try to convert manually
-            pass
-
         try:
-            # Attempt to obtain days and time
-            (
-                days,
-                time,
-            ) = value.split(",")
-
-            # Attempt to obtain hours, minutes, and seconds
-            (
-                hours,
-                minutes,
-                seconds,
-            ) = time.split(":")
-
-            # Check if all parts are digits
-            if not all(
-                [
-                    days.isdigit(),
-                    hours.isdigit(),
-                    minutes.isdigit(),
-                    seconds.isdigit(),
-                ]
-            ):
-                # Return None if the string cannot be converted to a timedelta
-                return None
-
             # Attempt to convert the string to a timedelta
-            return timedelta(
-                days=int(days),
-                hours=int(hours),
-                minutes=int(minutes),
-                seconds=int(seconds),
-            )
-        except ValueError:
-            # Return None if the string cannot be converted to a timedelta
+            return cls._str_to_timedelta_unchecked(value=value)
+        except (AttributeError, TypeError):
+            # Return None if the value is not a string
             return None
 
     @classmethod
@@ -1455,14 +2312,6 @@ class DataConversionUtils:
             Optional[timezone]: The timezone representation of the string or None if the string cannot be converted to a timezone.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
         try:
             # Attempt to convert the string to a timezone
             return timezone(value)
@@ -1485,34 +2334,29 @@ class DataConversionUtils:
             Optional[tuple]: The tuple representation of the string or None if the string cannot be converted to a tuple.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
+        try:
+            # Check if the string starts with '(' and ends with ')'
+            if len(value) < 2 or value[0] != "(" or value[-1] != ")":
+                # Return None if the string cannot be converted to a tuple
+                return None
+        except (AttributeError, TypeError):
             # Return None if the value is not a string
             return None
 
-        # Check if the string starts with '(' and ends with ')'
-        if not value.startswith("(") or not value.endswith(")"):
-            # Return None if the string cannot be converted to a tuple
-            return None
-
-        # Check if the string could be split by ':' (potentially being a dictionary)
-        if ":" in value:
-            # Return None if the string cannot be converted to a tuple
+        try:
+            # Attempt to parse the string as a Python literal
+            parsed: Any = ast.literal_eval(value)
+        except (MemoryError, RecursionError, SyntaxError, TypeError, ValueError):
+            # Return None if the string is not a valid Python literal
             return None
 
-        # Attempt to split the string by ','
-        parts = value[1:-1].split(",")
-
-        # Check if the string could not be split by ','
-        if not parts:
+        # Check if the string is not a tuple literal (e.g. a dictionary or a parenthesized scalar)
+        if type(parsed) is not tuple:
             # Return None if the string cannot be converted to a tuple
             return None
 
-        # Return the tuple representation of the string
-        return tuple(parts)
+        # Return the tuple
+        return parsed
 
     @classmethod
     def str_to_uuid(
@@ -1529,19 +2373,16 @@ class DataConversionUtils:
             Optional[UUID]: The UUID representation of the string or None if the value is not a string.
         """
 
-        # Check if the value is a string
-        if value is None or not isinstance(
-            value,
-            str,
-        ):
-            # Return None if the value is not a string
-            return None
-
         try:
-            # Attempt to convert the string to a UUID
-            return UUID(value)
-        except ValueError:
-            # Return None if the string is not a valid UUID
+            # Check if the string is too short to hold the 32 hexadecimal digits of a UUID
+            if len(value) < 32:
+                # Return None without raising and catching an exception
+                return None
+
+            # Attempt to convert the string to a UUID with the cached constructor
+            return _UUID(value)
+        except (AttributeError, TypeError, ValueError):
+            # Return None if the value is not a string or not a valid UUID
             return None
 
     @classmethod
@@ -1588,7 +2429,7 @@ class DataConversionUtils:
         """
 
         # Return the string representation of the timedelta
-        return cls.to_str(value=value)
+        return str(value)
 
     @classmethod
     def timezone_to_str(
@@ -1605,7 +2446,7 @@ class DataConversionUtils:
             str: The string representation of the timezone.
         """
 
-        return cls.to_str(value=value)
+        return str(value)
 
     @classmethod
     def to_bool(
@@ -1762,100 +2603,430 @@ class DataConversionUtils:
             encoding (Literal["utf-8", "ascii"]): The encoding to use. Defaults to "utf-8".
 
         Returns:
-            str: The string representation of the value.
+            str: The string representation of the value.
+
+        Raises:
+            UnicodeEncodeError: If the string representation cannot be encoded using the specified encoding.
+        """
+
+        # Convert the value to a string
+        result: str = str(value)
+
+        # Check if the encoding is not UTF-8, which needs no round trip to produce the same string
+        if encoding != "utf-8":
+            # Check that the string can be encoded using the specified encoding
+            result.encode(encoding)
+
+        # Return the string representation of the value
+        return result
+
+    @classmethod
+    def to_time(
+        cls,
+        value: Any,
+    ) -> time:
+        """
+        Convert a value to a time.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            time: The time representation of the value.
+        """
+
+        try:
+            # Attempt to convert the value to a time
+            return time(value)
+        except ValueError as ve:
+            # Raise a DataConversionError if the value cannot be converted to a time
+            raise DataConversionError(type_=time, value=value) from ve
+
+    @classmethod
+    def to_timedelta(
+        cls,
+        value: Any,
+    ) -> timedelta:
+        """
+        Convert a value to a timedelta.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            timedelta: The timedelta representation of the value.
+        """
+
+        try:
+            # Attempt to convert the value to a timedelta
+            return timedelta(value)
+        except ValueError as ve:
+            # Raise a DataConversionError if the value cannot be converted to a timedelta
+            raise DataConversionError(type_=timedelta, value=value) from ve
+
+    @classmethod
+    def to_uuid(
+        cls,
+        value: Any,
+    ) -> UUID:
+        """
+        Convert a value to a UUID.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            UUID: The UUID representation of the value.
+        """
+
+        try:
+            # Attempt to convert the value to a UUID
+            return UUID(value)
+        except ValueError as ve:
+            # Raise a DataConversionError if the value cannot be converted to a UUID
+            raise DataConversionError(type_=UUID, value=value) from ve
+
+    @classmethod
+    def uuid_to_str(
+        cls,
+        value: UUID,
+    ) -> str:
+        """
+        Convert a UUID to a string.
+
+        Args:
+            value (UUID): The UUID to convert.
+
+        Returns:
+            str: The string representation of the UUID.
+        """
+
+        return str(value)
+
+
+class DataIdentificationUtils:
+    """
+    A collection of utility functions for data processing.
+    """
+
+    @classmethod
+    def _could_be_constructed(
+        cls,
+        type_: type,
+        value: Any,
+    ) -> bool:
+        """
+        Checks if the value is an instance of the type or is accepted by its constructor.
+
+        Args:
+            type_ (type): The type to construct from the value.
+            value (Any): The value to check.
+
+        Returns:
+            bool: True if the value is an instance of the type or the constructor accepts it, False otherwise.
         """
 
-        # Convert the value to a string and encode it using the specified encoding
-        return str(value).encode(encoding=encoding).decode(encoding=encoding)
+        # Check if the value already is an instance of the type
+        if isinstance(value, type_):
+            # Return True without calling the constructor
+            return True
+
+        # Obtain the exact type of the value
+        value_type: type = type(value)
+
+        # Check if the value is immutable, the only kind of value whose result is cached
+        cacheable: bool = value_type in _IMMUTABLE_TYPES
+
+        # Check if the value is an immutable string or bytes
+        if cacheable and (value_type is str or value_type is bytes):
+            # Only cache short values, as the cache keeps its keys alive
+            cacheable = len(value) <= _COULD_BE_CACHE_MAX_LENGTH
+        # Check if the value is an integer
+        elif cacheable and value_type is int:
+            # Only cache small integers, as the cache keeps its keys alive
+            cacheable = value.bit_length() <= _COULD_BE_CACHE_MAX_BITS
+        # Check if the value is a decimal or a fraction, which are as unbounded in size as integers
+        elif cacheable and (value_type is Decimal or value_type is Fraction):
+            # Never cache them, which also keeps decimal NaNs, whose signaling variant cannot be compared, out of the cache
+            cacheable = False
+        # Check if the value is any other immutable value
+        elif cacheable:
+            # Only cache values equal to themselves, as NaN keys are never found again
+            cacheable = value == value
+
+        # Key the result by the type of the value as well, as equal values such as 1, 1.0 and True share a hash
+        key: tuple[type, type, Any] = (
+            type_,
+            value_type,
+            value,
+        )
+
+        # Check if the value might have been checked against the type before
+        if cacheable:
+            # Look up the cached result of the check
+            result: Optional[bool] = _COULD_BE_CACHE.get(key)
+
+            # Check if a result has been cached
+            if result is not None:
+                # Return the cached result
+                return result
+
+        try:
+            # Attempt to pass the value to the constructor
+            type_(value)
+
+            # Store that the constructor accepted the value
+            result = True
+        except Exception:
+            # Store that the constructor rejected the value
+            result = False
+
+        # Check if the result has to be cached
+        if cacheable:
+            # Check if the cache is full
+            if len(_COULD_BE_CACHE) >= _IDENTIFY_CACHE_SIZE:
+                # Drop all cached results instead of tracking their age
+                _COULD_BE_CACHE.clear()
+
+            # Cache the result of the check
+            _COULD_BE_CACHE[key] = result
+
+        # Return the result of the check
+        return result
 
     @classmethod
-    def to_time(
+    def _digit_masks(
         cls,
-        value: Any,
-    ) -> time:
+        strings: "np.ndarray",
+    ) -> tuple["np.ndarray", "np.ndarray"]:
         """
-        Convert a value to a time.
+        Mark the plain integer and plain decimal strings of a NumPy string array in a single pass each.
+
+        Plain strings consist of an optional sign followed by decimal digits, the decimal ones allowing a
+        single decimal point among them. All of them are valid integers or floats respectively, which is
+        why integers with more digits than 'int' converts are left unmarked.
 
         Args:
-            value (Any): The value to convert.
+            strings (np.ndarray): The NumPy string array to check.
 
         Returns:
-            time: The time representation of the value.
-        """
+            tuple[np.ndarray, np.ndarray]: The boolean masks of the plain integer strings and of the plain decimal strings, integers included.
+        """
+
+        # Check if there are no strings, which the numpy string routines cannot handle
+        if strings.size == 0:
+            # Return empty masks
+            return (
+                np.zeros(
+                    0,
+                    dtype=np.bool_,
+                ),
+                np.zeros(
+                    0,
+                    dtype=np.bool_,
+                ),
+            )
 
-        try:
-            # Attempt to convert the value to a time
-            return time(value)
-        except ValueError as ve:
-            # Raise a DataConversionError if the value cannot be converted to a time
-            raise DataConversionError(type_=time, value=value) from ve
+        # Strip the signs of the strings
+        unsigned: np.ndarray = np.char.lstrip(
+            strings,
+            "+-",
+        )
+
+        # Mark the strings that had at most one sign
+        single_sign: np.ndarray = (
+            np.char.str_len(strings) - np.char.str_len(unsigned)
+        ) <= 1
+
+        # Mark the strings whose unsigned part is made up of digits
+        integers: np.ndarray = np.char.isdecimal(unsigned) & single_sign
+
+        # Obtain the maximum number of digits 'int' converts
+        limit: int = _INT_MAX_STR_DIGITS()
+
+        # Check if the number of digits is limited
+        if limit:
+            # Unmark the integers with more digits than 'int' converts
+            integers &= np.char.str_len(unsigned) <= limit
+
+        # Return the masks of the integer strings and of the strings whose unsigned part is made up of digits with one decimal point at most
+        return (
+            integers,
+            np.char.isdecimal(
+                np.char.replace(
+                    unsigned,
+                    ".",
+                    "",
+                    1,
+                )
+            )
+            & single_sign,
+        )
 
     @classmethod
-    def to_timedelta(
+    def _has_default_instance_check(
         cls,
-        value: Any,
-    ) -> timedelta:
+        type_: Any,
+    ) -> bool:
         """
-        Convert a value to a timedelta.
+        Checks if the instance check against a type or tuple of types only depends on the class of the value.
 
         Args:
-            value (Any): The value to convert.
+            type_ (Any): The type or tuple of types to check.
 
         Returns:
-            timedelta: The timedelta representation of the value.
+            bool: True if the metaclass of every type keeps the default instance check, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a timedelta
-            return timedelta(value)
-        except ValueError as ve:
-            # Raise a DataConversionError if the value cannot be converted to a timedelta
-            raise DataConversionError(type_=timedelta, value=value) from ve
+        # Check if the type is a tuple of types
+        if type(type_) is tuple:
+            # Return whether every type of the tuple keeps the default instance check
+            return all(
+                cls._has_default_instance_check(type_=member) for member in type_
+            )
+
+        # Return whether the metaclass of the type keeps the default instance check
+        return type(type_).__instancecheck__ is _TYPE_INSTANCECHECK
 
     @classmethod
-    def to_uuid(
+    def _identify_in_str_uncached(
         cls,
-        value: Any,
-    ) -> UUID:
+        value: str,
+    ) -> Optional[type]:
         """
-        Convert a value to a UUID.
+        Identify the type of information contained within a string without using the cache.
 
         Args:
-            value (Any): The value to convert.
+            value (str): The string to identify.
 
         Returns:
-            UUID: The UUID representation of the value.
+            Optional[type]: The type of the string, Path for strings that encode no other type, or None if the value is not a string.
         """
 
-        try:
-            # Attempt to convert the value to a UUID
-            return UUID(value)
-        except ValueError as ve:
-            # Raise a DataConversionError if the value cannot be converted to a UUID
-            raise DataConversionError(type_=UUID, value=value) from ve
+        # Check if the value is not a string
+        if not isinstance(
+            value,
+            str,
+        ):
+            # Return None as only strings can be identified
+            return None
+
+        # Obtain the first character of the string
+        first: str = value[:1]
+
+        # Iterate over the container types that can start with the first character of the string
+        for (
+            type_,
+            converter,
+        ) in _CONTAINER_DISPATCH.get(first, ()):
+            # Check if the string can successfully be converted to the container type
+            if converter(value=value) is not None:
+                # Return the container type
+                return type_
+
+        # Check if the string could start any of the scalar encodings (a parenthesized complex number included)
+        if first in _IDENTIFY_FIRST_CHARS:
+            # Check if the string is a UUID in its canonical form, which the single pass only reaches after backtracking through all other encodings
+            if len(value) == 36 and _UUID_MATCH(value) is not None:
+                # Return UUID without running the single pass
+                return UUID
+
+            # Match the string against the encodings of all recognized scalar types in a single pass
+            match: Optional[re.Match[str]] = _IDENTIFY_MATCH(value)
+
+            # Check if the string encodes a recognized scalar type
+            if match is not None:
+                # Obtain the type and the converter of the matched encoding
+                (
+                    type_,
+                    converter,
+                ) = _IDENTIFY_DISPATCH[match.lastgroup]
+
+                # Check if the match needs no confirmation or the converter confirms it, as some patterns do not validate ranges such as months
+                if converter is None or converter(value=value) is not None:
+                    # Return the type of the matched encoding
+                    return type_
+
+        # Iterate over the scalar converters, which also accept the spellings the single pass does not cover
+        for (
+            type_,
+            converter,
+            first_chars,
+        ) in _IDENTIFY_FALLBACK:
+            # Check if the string starts with a character no encoding the converter accepts starts with
+            if first_chars is not None and not (
+                first.isdigit() or first.isspace() or first in first_chars
+            ):
+                # Skip the converter without calling it
+                continue
+
+            # Check if the string can successfully be converted by the converter
+            if converter(value=value) is not None:
+                # Return the type of the converter
+                return type_
+
+        # Return path without constructing one, as 'str_to_path' converts any other string to a path
+        return Path
 
     @classmethod
-    def uuid_to_str(
+    def _to_str_array(
         cls,
-        value: UUID,
-    ) -> str:
+        values: list[Any],
+    ) -> tuple["np.ndarray", "np.ndarray"]:
         """
-        Convert a UUID to a string.
+        Convert values to a NumPy string array along with the mask of the values it represents faithfully.
+
+        NumPy turns other values into their text and strips trailing NUL characters, so only strings without
+        NUL characters are represented faithfully. The other values are replaced with empty strings, which
+        no check made inside numpy accepts, and have to be checked on their own.
 
         Args:
-            value (UUID): The UUID to convert.
+            values (list[Any]): The values to convert.
 
         Returns:
-            str: The string representation of the UUID.
+            tuple[np.ndarray, np.ndarray]: The NumPy string array and the boolean mask of the values it represents faithfully.
         """
 
-        return cls.to_str(value=value)
+        # Check if all values are strings without NUL characters, as is usually the case
+        if all(type(value) is str for value in values) and "\x00" not in "".join(
+            values
+        ):
+            # Return the strings as they are and a mask marking all of them
+            return (
+                np.array(
+                    values,
+                    dtype=np.str_,
+                ),
+                np.ones(
+                    len(values),
+                    dtype=np.bool_,
+                ),
+            )
 
+        # Mark the strings without NUL characters
+        faithful: np.ndarray = np.fromiter(
+            (type(value) is str and "\x00" not in value for value in values),
+            dtype=np.bool_,
+            count=len(values),
+        )
 
-class DataIdentificationUtils:
-    """
-    A collection of utility functions for data processing.
-    """
+        # Return the strings without NUL characters, empty strings in place of the other values, and their mask
+        return (
+            np.array(
+                [
+                    value if valid else ""
+                    for (
+                        value,
+                        valid,
+                    ) in zip(
+                        values,
+                        faithful,
+                    )
+                ],
+                dtype=np.str_,
+            ),
+            faithful,
+        )
 
     @classmethod
     def could_be_bool(
@@ -1872,15 +3043,19 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a boolean, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a boolean
-            bool(value)
+        # Check if the value is a string
+        if isinstance(
+            value,
+            str,
+        ):
+            # Return True if the string is one of the strings recognized by 'str_to_bool'
+            return value.lower() in _STR_TO_BOOL_MAP
 
-            # Return True if the value could be converted to a boolean
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a boolean
-            return False
+        # Return True if the value is a boolean or an integer (bool being a subclass of int)
+        return isinstance(
+            value,
+            int,
+        )
 
     @classmethod
     def could_be_bytes(
@@ -1897,15 +3072,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to bytes, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to bytes
-            bytes(value)
-
-            # Return True if the value could be converted to bytes
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to bytes
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=bytes,
+            value=value,
+        )
 
     @classmethod
     def could_be_complex(
@@ -1922,16 +3093,17 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a complex number, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a complex number
-            complex(value)
-
-            # Return True if the value could be converted to a complex number
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a complex number
+        # Check if the value is a string the constructor would reject
+        if type(value) is str and _COULD_BE_COMPLEX_MATCH(value) is None:
+            # Return False without raising and catching an exception
             return False
 
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=complex,
+            value=value,
+        )
+
     @classmethod
     def could_be_counter(
         cls,
@@ -1947,15 +3119,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a counter, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a counter
-            Counter(value)
-
-            # Return True if the value could be converted to a counter
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a counter
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=Counter,
+            value=value,
+        )
 
     @classmethod
     def could_be_date(
@@ -1972,15 +3140,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a date, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a date
-            date(value)
-
-            # Return True if the value could be converted to a date
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a date
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=date,
+            value=value,
+        )
 
     @classmethod
     def could_be_datetime(
@@ -1997,15 +3161,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a datetime, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a datetime
-            datetime(value)
-
-            # Return True if the value could be converted to a datetime
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a datetime
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=datetime,
+            value=value,
+        )
 
     @classmethod
     def could_be_decimal(
@@ -2022,16 +3182,17 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a decimal, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a decimal
-            Decimal(value)
-
-            # Return True if the value could be converted to a decimal
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a decimal
+        # Check if the value is a string the constructor would reject
+        if type(value) is str and _COULD_BE_DECIMAL_MATCH(value) is None:
+            # Return False without raising and catching an exception
             return False
 
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=Decimal,
+            value=value,
+        )
+
     @classmethod
     def could_be_defaultdict(
         cls,
@@ -2047,15 +3208,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a defaultdict, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a defaultdict
-            defaultdict(value)
-
-            # Return True if the value could be converted to a defaultdict
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a defaultdict
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=defaultdict,
+            value=value,
+        )
 
     @classmethod
     def could_be_deque(
@@ -2072,15 +3229,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a deque, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a deque
-            deque(value)
-
-            # Return True if the value could be converted to a deque
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a deque
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=deque,
+            value=value,
+        )
 
     @classmethod
     def could_be_dict(
@@ -2090,6 +3243,9 @@ class DataIdentificationUtils:
         """
         Checks if the value could be converted to a dictionary.
 
+        Strings are accepted if 'str_to_dict' can parse them and other values if they are mappings, which is
+        checked without iterating over the value.
+
         Args:
             value (Any): The value to check.
 
@@ -2097,15 +3253,19 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a dictionary, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a dictionary
-            dict(value)
+        # Check if the value is a string
+        if isinstance(
+            value,
+            str,
+        ):
+            # Return whether the string can be parsed as a dictionary
+            return DataConversionUtils.str_to_dict(value=value) is not None
 
-            # Return True if the value could be converted to a dictionary
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a dictionary
-            return False
+        # Return whether the value is a mapping, without building a dictionary from it
+        return isinstance(
+            value,
+            Mapping,
+        )
 
     @classmethod
     def could_be_float(
@@ -2122,16 +3282,56 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a float, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a float
-            float(value)
-
-            # Return True if the value could be converted to a float
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a float
+        # Check if the value is a string the constructor would reject
+        if type(value) is str and _COULD_BE_FLOAT_MATCH(value) is None:
+            # Return False without raising and catching an exception
             return False
 
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=float,
+            value=value,
+        )
+
+    @classmethod
+    def could_be_float_array(
+        cls,
+        values: Iterable[str],
+    ) -> "np.ndarray":
+        """
+        Checks which of the strings could be converted to a float, checking plain decimal strings in a single pass.
+
+        Args:
+            values (Iterable[str]): The strings to check.
+
+        Returns:
+            np.ndarray: A boolean mask that is True where the string could be converted to a float.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+
+        # Check if numpy is available
+        if not NUMPY_AVAILABLE:
+            # Raise an ImportError if numpy is not installed
+            raise ImportError("numpy is required for array identification")
+
+        # Collect the strings, as they are traversed more than once
+        strings: list[str] = list(values)
+
+        # Mark the plain decimal strings inside numpy, as they always are valid, leaving the values numpy cannot represent faithfully to the check below
+        mask: np.ndarray = cls._digit_masks(
+            strings=cls._to_str_array(values=strings)[0]
+        )[1]
+
+        # Iterate over the indices of the strings that are not plain decimal strings
+        for index in np.flatnonzero(~mask):
+            # Check the string on its own, accepting whitespace, underscores and other spellings
+            mask[index] = cls.could_be_float(value=strings[index])
+
+        # Return the mask of the strings that could be converted
+        return mask
+
     @classmethod
     def could_be_fraction(
         cls,
@@ -2147,15 +3347,23 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a fraction, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a fraction
-            Fraction(value)
-
-            # Return True if the value could be converted to a fraction
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a fraction
-            return False
+        # Check if the value is a string
+        if type(value) is str:
+            # Check if the string is an integer or a fraction with a non-zero denominator
+            if _FRACTION_MATCH(value) is not None:
+                # Return True without constructing a fraction
+                return True
+
+            # Check if the string is one the constructor would reject
+            if _COULD_BE_FRACTION_MATCH(value) is None:
+                # Return False without raising and catching an exception
+                return False
+
+        # Return whether the constructor accepts the value, which also handles decimals and exponents
+        return cls._could_be_constructed(
+            type_=Fraction,
+            value=value,
+        )
 
     @classmethod
     def could_be_frozendict(
@@ -2165,6 +3373,9 @@ class DataIdentificationUtils:
         """
         Checks if the value could be converted to a frozendict.
 
+        Strings are accepted if 'str_to_frozendict' can parse them and other values if they are mappings, which is
+        checked without iterating over the value.
+
         Args:
             value (Any): The value to check.
 
@@ -2172,15 +3383,19 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a frozendict, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a frozendict
-            frozendict(value)
+        # Check if the value is a string
+        if isinstance(
+            value,
+            str,
+        ):
+            # Return whether the string can be parsed as a frozendict
+            return DataConversionUtils.str_to_frozendict(value=value) is not None
 
-            # Return True if the value could be converted to a frozendict
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a frozendict
-            return False
+        # Return whether the value is a mapping, without building a frozendict from it
+        return isinstance(
+            value,
+            Mapping,
+        )
 
     @classmethod
     def could_be_frozenset(
@@ -2190,6 +3405,9 @@ class DataIdentificationUtils:
         """
         Checks if the value could be converted to a frozenset.
 
+        Strings are accepted if 'str_to_frozenset' can parse them and other values if they are iterables, which is
+        checked without iterating over the value.
+
         Args:
             value (Any): The value to check.
 
@@ -2197,15 +3415,19 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a frozenset, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a frozenset
-            frozenset(value)
+        # Check if the value is a string
+        if isinstance(
+            value,
+            str,
+        ):
+            # Return whether the string can be parsed as a frozenset
+            return DataConversionUtils.str_to_frozenset(value=value) is not None
 
-            # Return True if the value could be converted to a frozenset
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a frozenset
-            return False
+        # Return whether the value is iterable, without building a frozenset from it
+        return isinstance(
+            value,
+            Iterable,
+        )
 
     @classmethod
     def could_be_int(
@@ -2222,15 +3444,55 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to an integer, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to an integer
-            int(value)
+        # Check if the value is a string the constructor would reject
+        if type(value) is str and _COULD_BE_INT_MATCH(value) is None:
+            # Return False without raising and catching an exception
+            return False
+
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=int,
+            value=value,
+        )
+
+    @classmethod
+    def could_be_int_array(
+        cls,
+        values: Iterable[str],
+    ) -> "np.ndarray":
+        """
+        Checks which of the strings could be converted to an integer, checking plain integer strings in a single pass.
+
+        Args:
+            values (Iterable[str]): The strings to check.
+
+        Returns:
+            np.ndarray: A boolean mask that is True where the string could be converted to an integer.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+
+        # Check if numpy is available
+        if not NUMPY_AVAILABLE:
+            # Raise an ImportError if numpy is not installed
+            raise ImportError("numpy is required for array identification")
+
+        # Collect the strings, as they are traversed more than once
+        strings: list[str] = list(values)
 
-            # Return True if the value could be converted to an integer
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to an integer
-            return False
+        # Mark the plain integer strings inside numpy, as they always are valid, leaving the values numpy cannot represent faithfully to the check below
+        mask: np.ndarray = cls._digit_masks(
+            strings=cls._to_str_array(values=strings)[0]
+        )[0]
+
+        # Iterate over the indices of the strings that are not plain integer strings
+        for index in np.flatnonzero(~mask):
+            # Check the string on its own, accepting whitespace, underscores and other spellings
+            mask[index] = cls.could_be_int(value=strings[index])
+
+        # Return the mask of the strings that could be converted
+        return mask
 
     @classmethod
     def could_be_list(
@@ -2240,6 +3502,9 @@ class DataIdentificationUtils:
         """
         Checks if the value could be converted to a list.
 
+        Strings are accepted if 'str_to_list' can parse them and other values if they are iterables, which is
+        checked without iterating over the value.
+
         Args:
             value (Any): The value to check.
 
@@ -2247,15 +3512,19 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a list, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a list
-            list(value)
+        # Check if the value is a string
+        if isinstance(
+            value,
+            str,
+        ):
+            # Return whether the string can be parsed as a list
+            return DataConversionUtils.str_to_list(value=value) is not None
 
-            # Return True if the value could be converted to a list
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a list
-            return False
+        # Return whether the value is iterable, without building a list from it
+        return isinstance(
+            value,
+            Iterable,
+        )
 
     @classmethod
     def could_be_path(
@@ -2265,6 +3534,8 @@ class DataIdentificationUtils:
         """
         Checks if the value could be converted to a path.
 
+        Strings and path-like objects are accepted without constructing a path from them.
+
         Args:
             value (Any): The value to check.
 
@@ -2272,15 +3543,14 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a path, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a path
-            Path(value)
-
-            # Return True if the value could be converted to a path
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a path
-            return False
+        # Return whether the value is a string or implements the path protocol
+        return isinstance(
+            value,
+            str,
+        ) or isinstance(
+            value,
+            PathLike,
+        )
 
     @classmethod
     def could_be_set(
@@ -2290,6 +3560,9 @@ class DataIdentificationUtils:
         """
         Checks if the value could be converted to a set.
 
+        Strings are accepted if 'str_to_set' can parse them and other values if they are iterables, which is
+        checked without iterating over the value.
+
         Args:
             value (Any): The value to check.
 
@@ -2297,15 +3570,19 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a set, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a set
-            set(value)
+        # Check if the value is a string
+        if isinstance(
+            value,
+            str,
+        ):
+            # Return whether the string can be parsed as a set
+            return DataConversionUtils.str_to_set(value=value) is not None
 
-            # Return True if the value could be converted to a set
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a set
-            return False
+        # Return whether the value is iterable, without building a set from it
+        return isinstance(
+            value,
+            Iterable,
+        )
 
     @classmethod
     def could_be_time(
@@ -2322,15 +3599,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a time, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a time
-            time(value)
-
-            # Return True if the value could be converted to a time
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a time
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=time,
+            value=value,
+        )
 
     @classmethod
     def could_be_timedelta(
@@ -2347,15 +3620,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a timedelta, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a timedelta
-            timedelta(value)
-
-            # Return True if the value could be converted to a timedelta
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a timedelta
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=timedelta,
+            value=value,
+        )
 
     @classmethod
     def could_be_timezone(
@@ -2372,15 +3641,11 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a timezone, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a timezone
-            timezone(value)
-
-            # Return True if the value could be converted to a timezone
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a timezone
-            return False
+        # Return whether the constructor accepts the value
+        return cls._could_be_constructed(
+            type_=timezone,
+            value=value,
+        )
 
     @classmethod
     def could_be_tuple(
@@ -2390,6 +3655,9 @@ class DataIdentificationUtils:
         """
         Checks if the value could be converted to a tuple.
 
+        Strings are accepted if 'str_to_tuple' can parse them and other values if they are iterables, which is
+        checked without iterating over the value.
+
         Args:
             value (Any): The value to check.
 
@@ -2397,15 +3665,19 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a tuple, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a tuple
-            tuple(value)
+        # Check if the value is a string
+        if isinstance(
+            value,
+            str,
+        ):
+            # Return whether the string can be parsed as a tuple
+            return DataConversionUtils.str_to_tuple(value=value) is not None
 
-            # Return True if the value could be converted to a tuple
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a tuple
-            return False
+        # Return whether the value is iterable, without building a tuple from it
+        return isinstance(
+            value,
+            Iterable,
+        )
 
     @classmethod
     def could_be_uuid(
@@ -2422,15 +3694,72 @@ class DataIdentificationUtils:
             bool: True if the value could be converted to a UUID, False otherwise.
         """
 
-        try:
-            # Attempt to convert the value to a UUID
-            UUID(value)
+        # Check if the value is a string
+        if type(value) is str:
+            # Check if the string is a UUID in its canonical hyphenated form
+            if len(value) == 36 and _UUID_MATCH(value) is not None:
+                # Return True without constructing a UUID
+                return True
+
+            # Check if the string is one the constructor would reject
+            if _COULD_BE_UUID_MATCH(value) is None:
+                # Return False without raising and catching an exception
+                return False
+
+        # Return whether the constructor accepts the value, which also handles braces, URNs and missing hyphens
+        return cls._could_be_constructed(
+            type_=UUID,
+            value=value,
+        )
 
-            # Return True if the value could be converted to a UUID
-            return True
-        except ValueError:
-            # Return False if the value could not be converted to a UUID
-            return False
+    @classmethod
+    def could_be_uuid_array(
+        cls,
+        values: Iterable[str],
+    ) -> "np.ndarray":
+        """
+        Checks which of the strings could be converted to a UUID, rejecting strings too short to be one in a single pass.
+
+        Args:
+            values (Iterable[str]): The strings to check.
+
+        Returns:
+            np.ndarray: A boolean mask that is True where the string could be converted to a UUID.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+
+        # Check if numpy is available
+        if not NUMPY_AVAILABLE:
+            # Raise an ImportError if numpy is not installed
+            raise ImportError("numpy is required for array identification")
+
+        # Collect the strings, as they are traversed more than once
+        strings: list[str] = list(values)
+
+        # Convert the strings to a numpy string array along with the mask of the values it represents faithfully
+        (
+            array,
+            faithful,
+        ) = cls._to_str_array(values=strings)
+
+        # Mark the strings that are long enough to hold the 32 hexadecimal digits of a UUID inside numpy, and the values numpy cannot represent faithfully
+        candidates: np.ndarray = (np.char.str_len(array) >= 32) | ~faithful
+
+        # Mask of the strings that could be converted
+        mask: np.ndarray = np.zeros(
+            len(strings),
+            dtype=np.bool_,
+        )
+
+        # Iterate over the indices of the strings that are long enough and the values numpy cannot represent faithfully
+        for index in np.flatnonzero(candidates):
+            # Check the string on its own
+            mask[index] = cls.could_be_uuid(value=strings[index])
+
+        # Return the mask of the strings that could be converted
+        return mask
 
     @classmethod
     def identify(
@@ -2447,8 +3776,30 @@ class DataIdentificationUtils:
             str: The type of the value.
         """
 
-        # Return the type of the value
-        return type(value).__name__
+        # Obtain the exact type of the value
+        type_: type = type(value)
+
+        # Look up the cached name of the type
+        name: Optional[str] = _TYPE_NAME_CACHE.get(type_)
+
+        # Check if the name has been cached
+        if name is not None:
+            # Return the cached name of the type
+            return name
+
+        # Obtain the name of the type
+        name = type_.__name__
+
+        # Check if the cache is full
+        if len(_TYPE_NAME_CACHE) >= _TYPE_NAME_CACHE_SIZE:
+            # Drop all cached names instead of tracking their age
+            _TYPE_NAME_CACHE.clear()
+
+        # Cache the name of the type
+        _TYPE_NAME_CACHE[type_] = name
+
+        # Return the name of the type
+        return name
 
     @classmethod
     def identify_in_str(
@@ -2458,95 +3809,125 @@ class DataIdentificationUtils:
         """
         Identify the type of information contained within a string.
 
+        The result is cached for repeated strings.
+
         Args:
             value (str): The string to identify.
 
         Returns:
-            Optional[type]: The type of the string or None if the type cannot be identified.
+            Optional[type]: The type of the string, Path for strings that encode no other type, or None if the value is not a string.
         """
 
-        # Check if the string can successfully be converted to a boolean
-        if DataConversionUtils.str_to_bool(value=value):
-            # Return bool if the string can be converted to a boolean
-            return bool
+        # Check if the value is not a string and cannot be cached
+        if type(value) is not str:
+            # Return the type identified without the cache
+            return cls._identify_in_str_uncached(value=value)
 
-        # Check if the string can successfully be converted to a complex
-        elif DataConversionUtils.str_to_complex(value=value):
-            # Return complex if the string can be converted to a complex
-            return complex
+        # Look up the type identified for the string before
+        result: Any = _IDENTIFY_CACHE.get(value, _MISSING)
 
-        # Check if the string can successfully be converted to a dictionary
-        elif DataConversionUtils.str_to_dict(value=value):
-            # Return dict if the string can be converted to a dictionary
-            return dict
+        # Check if the type has been cached
+        if result is not _MISSING:
+            # Return the cached type
+            return result
 
-        # Check if the string can successfully be converted to a float
-        elif DataConversionUtils.str_to_float(value=value):
-            # Return float if the string can be converted to a float
-            return float
+        # Identify the type of the string
+        result = cls._identify_in_str_uncached(value=value)
 
-        # Check if the string can successfully be converted to an integer
-        elif DataConversionUtils.str_to_int(value=value):
-            # Return int if the string can be converted to an integer
-            return int
+        # Check if the cache is full
+        if len(_IDENTIFY_CACHE) >= _IDENTIFY_CACHE_SIZE:
+            # Drop all cached types instead of tracking their age
+            _IDENTIFY_CACHE.clear()
 
-        # Check if the string can successfully be converted to a list
-        elif DataConversionUtils.str_to_list(value=value):
-            # Return list if the string can be converted to a list
-            return list
-
-        # Check if the string can successfully be converted to a set
-        elif DataConversionUtils.str_to_set(value=value):
-            # Return set if the string can be converted to a set
-            return set
-
-        # Check if the string can successfully be converted to a tuple
-        elif DataConversionUtils.str_to_tuple(value=value):
-            # Return tuple if the string can be converted to a tuple
-            return tuple
-
-        # Check if the string can successfully be converted to a date
-        elif DataConversionUtils.str_to_date(value=value):
-            # Return date if the string can be converted to a date
-            return date
-
-        # Check if the string can successfully be converted to a datetime
-        elif DataConversionUtils.str_to_datetime(value=value):
-            # Return datetime if the string can be converted to a datetime
-            return datetime
-
-        # Check if the string can successfully be converted to a time
-        elif DataConversionUtils.str_to_time(value=value):
-            # Return time if the string can be converted to a time
-            return time
-
-        # Check if the string can successfully be converted to a timedelta
-        elif DataConversionUtils.str_to_timedelta(value=value):
-            # Return timedelta if the string can be converted to a timedelta
-            return timedelta
-
-        # Check if the string can successfully be converted to a timezone
-        elif DataConversionUtils.str_to_timezone(value=value):
-            # Return timezone if the string can be converted to a timezone
-            return timezone
-
-        # Check if the string can successfully be converted to a uuid
-        elif DataConversionUtils.str_to_uuid(value=value):
-            # Return uuid if the string can be converted to a uuid
-            return UUID
-
-        # Check if the string can successfully be converted to a path
-        elif DataConversionUtils.str_to_path(value=value):
-            # Return path if the string can be converted to a path
-            return Path
-
-        # Check if the string can successfully be converted to bytes
-        elif DataConversionUtils.str_to_bytes(value=value):
-            # Return bytes if the string can be converted to bytes
-            return bytes
-
-        # Return None if the string cannot be converted at all
-        return None
+        # Cache the identified type
+        _IDENTIFY_CACHE[value] = result
+
+        # Return the identified type
+        return result
+
+    @classmethod
+    def identify_in_str_array(
+        cls,
+        values: Iterable[str],
+    ) -> "np.ndarray":
+        """
+        Identify the type of information contained within each of the strings.
+
+        Plain integer and decimal strings are identified in a single pass and each other distinct string
+        is identified once, however often it occurs.
+
+        Args:
+            values (Iterable[str]): The strings to identify.
+
+        Returns:
+            np.ndarray: An object array holding the type of each string or None where the type cannot be identified.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+
+        # Check if numpy is available
+        if not NUMPY_AVAILABLE:
+            # Raise an ImportError if numpy is not installed
+            raise ImportError("numpy is required for array identification")
+
+        # Collect the strings, as they are traversed more than once
+        strings: list[str] = list(values)
+
+        # Convert the strings to a numpy string array, leaving the values it cannot represent faithfully unmarked below
+        array: np.ndarray = cls._to_str_array(values=strings)[0]
+
+        # Mark the plain integer and plain decimal strings inside numpy
+        (
+            integers,
+            decimals,
+        ) = cls._digit_masks(strings=array)
+
+        # Mark the ASCII strings by their code points, as 'identify_in_str' only recognizes ASCII digits
+        ascii_: np.ndarray = (
+            array.view(np.uint32).reshape(
+                len(strings),
+                array.itemsize // 4,
+            )
+            < 128
+        ).all(axis=1)
+
+        # Restrict the plain numeric strings to the ASCII ones
+        integers &= ascii_
+        decimals &= ascii_
+
+        # Array of the identified types, assigning the plain numeric strings their type at once
+        result: np.ndarray = np.empty(
+            len(strings),
+            dtype=object,
+        )
+        result[decimals] = float
+        result[integers] = int
+
+        # Types identified for the distinct remaining strings
+        types: dict[str, Optional[type]] = {}
+
+        # Iterate over the indices of the strings that are not plain numeric strings
+        for index in np.flatnonzero(~decimals):
+            # Obtain the string at the index
+            string: str = strings[index]
+
+            # Look up the type identified for the same string before
+            type_: Any = types.get(
+                string,
+                _MISSING,
+            )
+
+            # Check if the string has not been identified yet
+            if type_ is _MISSING:
+                # Identify the type of the string
+                type_ = types[string] = cls.identify_in_str(value=string)
+
+            # Store the type identified for the string
+            result[index] = type_
+
+        # Return the array of the identified types
+        return result
 
     @classmethod
     def identify_numeric_type(
@@ -2556,6 +3937,9 @@ class DataIdentificationUtils:
         """
         Identifies the numeric type of the value.
 
+        Numbers are identified by their own type and common numeric strings by a single regex pass, while
+        other values are checked against int, float, complex and Decimal in that order.
+
         Args:
             value (Any): The value to identify.
 
@@ -2563,6 +3947,35 @@ class DataIdentificationUtils:
             Optional[type]: The numeric type of the value, or None if the value is not numeric.
         """
 
+        # Obtain the exact type of the value
+        type_: type = type(value)
+
+        # Check if the value is a string
+        if type_ is str:
+            # Match the string against the common numeric encodings in a single pass
+            match: Optional[re.Match[str]] = _NUMERIC_MATCH(value)
+
+            # Check if the string is a common numeric encoding
+            if match is not None:
+                # Obtain the name of the matched group
+                group: str = match.lastgroup
+
+                # Obtain the maximum number of digits 'int' converts
+                limit: int = _INT_MAX_STR_DIGITS()
+
+                # Check if the string is no integer that may have more digits than 'int' converts, which the checks below settle
+                if group != "int" or not limit or len(value) <= limit:
+                    # Return the type named by the matched group
+                    return _NUMERIC_DISPATCH[group]
+
+        # Look up the numeric type of a value that already is a number
+        numeric_type: Optional[type] = _NUMERIC_TYPES.get(type_)
+
+        # Check if the value already is a number
+        if numeric_type is not None:
+            # Return the numeric type of the number
+            return numeric_type
+
         # Check if the value could be an int
         if cls.could_be_int(value=value):
             # Return int if the value could be an int
@@ -2598,11 +4011,8 @@ class DataIdentificationUtils:
             bool: True if the value is a boolean, False otherwise.
         """
 
-        # Check if the value is an instance of bool
-        return cls.is_instance(
-            type_=bool,
-            value=value,
-        )
+        # Check if the value is exactly of type bool, which cannot be subclassed and needs no instance check
+        return type(value) is bool
 
     @classmethod
     def is_bytes(
@@ -2619,10 +4029,10 @@ class DataIdentificationUtils:
             bool: True if the value is an instance of bytes, False otherwise.
         """
 
-        # Check if the value is an instance of bytes
-        return cls.is_instance(
-            type_=bytes,
-            value=value,
+        # Check if the value is exactly of type bytes before falling back to an instance check
+        return type(value) is bytes or isinstance(
+            value,
+            bytes,
         )
 
     @classmethod
@@ -2640,10 +4050,10 @@ class DataIdentificationUtils:
             bool: True if the value is an instance of complex, False otherwise.
         """
 
-        # Check if the value is an instance of complex
-        return cls.is_instance(
-            type_=complex,
-            value=value,
+        # Check if the value is exactly of type complex before falling back to an instance check
+        return type(value) is complex or isinstance(
+            value,
+            complex,
         )
 
     @classmethod
@@ -2661,10 +4071,10 @@ class DataIdentificationUtils:
             bool: True if the value is a counter, False otherwise.
         """
 
-        # Check if the value is an instance of Counter
-        return cls.is_instance(
-            type_=Counter,
-            value=value,
+        # Check if the value is exactly of type Counter before falling back to an instance check
+        return type(value) is Counter or isinstance(
+            value,
+            Counter,
         )
 
     @classmethod
@@ -2682,10 +4092,10 @@ class DataIdentificationUtils:
             bool: True if the value is a date, False otherwise.
         """
 
-        # Check if the value is an instance of date
-        return cls.is_instance(
-            type_=date,
-            value=value,
+        # Check if the value is exactly of type date before falling back to an instance check
+        return type(value) is date or isinstance(
+            value,
+            date,
         )
 
     @classmethod
@@ -2703,10 +4113,10 @@ class DataIdentificationUtils:
             bool: True if the value is a datetime, False otherwise.
         """
 
-        # Check if the value is an instance of datetime
-        return cls.is_instance(
-            type_=datetime,
-            value=value,
+        # Check if the value is exactly of type datetime before falling back to an instance check
+        return type(value) is datetime or isinstance(
+            value,
+            datetime,
         )
 
     @classmethod
@@ -2724,10 +4134,10 @@ class DataIdentificationUtils:
             bool: True if the value is a decimal, False otherwise.
         """
 
-        # Check if the value is an instance of Decimal
-        return cls.is_instance(
-            type_=Decimal,
-            value=value,
+        # Check if the value is exactly of type Decimal before falling back to an instance check
+        return type(value) is Decimal or isinstance(
+            value,
+            Decimal,
         )
 
     @classmethod
@@ -2745,10 +4155,10 @@ class DataIdentificationUtils:
             bool: True if the value is a defaultdict, False otherwise.
         """
 
-        # Check if the value is an instance of defaultdict
-        return cls.is_instance(
-            type_=defaultdict,
-            value=value,
+        # Check if the value is exactly of type defaultdict before falling back to an instance check
+        return type(value) is defaultdict or isinstance(
+            value,
+            defaultdict,
         )
 
     @classmethod
@@ -2766,10 +4176,10 @@ class DataIdentificationUtils:
             bool: True if the value is a deque, False otherwise.
         """
 
-        # Check if the value is an instance of deque
-        return cls.is_instance(
-            type_=deque,
-            value=value,
+        # Check if the value is exactly of type deque before falling back to an instance check
+        return type(value) is deque or isinstance(
+            value,
+            deque,
         )
 
     @classmethod
@@ -2787,10 +4197,10 @@ class DataIdentificationUtils:
             bool: True if the value is a dictionary, False otherwise.
         """
 
-        # Check if the value is an instance of dict
-        return cls.is_instance(
-            type_=dict,
-            value=value,
+        # Check if the value is exactly of type dict before falling back to an instance check
+        return type(value) is dict or isinstance(
+            value,
+            dict,
         )
 
     @classmethod
@@ -2808,10 +4218,10 @@ class DataIdentificationUtils:
             bool: True if the value is a float, False otherwise.
         """
 
-        # Check if the value is an instance of float
-        return cls.is_instance(
-            type_=float,
-            value=value,
+        # Check if the value is exactly of type float before falling back to an instance check
+        return type(value) is float or isinstance(
+            value,
+            float,
         )
 
     @classmethod
@@ -2829,10 +4239,10 @@ class DataIdentificationUtils:
             bool: True if the value is a fraction, False otherwise.
         """
 
-        # Check if the value is an instance of Fraction
-        return cls.is_instance(
-            type_=Fraction,
-            value=value,
+        # Check if the value is exactly of type Fraction before falling back to an instance check
+        return type(value) is Fraction or isinstance(
+            value,
+            Fraction,
         )
 
     @classmethod
@@ -2850,10 +4260,10 @@ class DataIdentificationUtils:
             bool: True if the value is a frozendict, False otherwise.
         """
 
-        # Check if the value is an instance of frozendict
-        return cls.is_instance(
-            type_=frozendict,
-            value=value,
+        # Check if the value is exactly of type frozendict before falling back to an instance check
+        return type(value) is frozendict or isinstance(
+            value,
+            frozendict,
         )
 
     @classmethod
@@ -2871,10 +4281,10 @@ class DataIdentificationUtils:
             bool: True if the value is a frozenset, False otherwise.
         """
 
-        # Check if the value is an instance of frozenset
-        return cls.is_instance(
-            type_=frozenset,
-            value=value,
+        # Check if the value is exactly of type frozenset before falling back to an instance check
+        return type(value) is frozenset or isinstance(
+            value,
+            frozenset,
         )
 
     @classmethod
@@ -2886,6 +4296,10 @@ class DataIdentificationUtils:
         """
         Checks if the value is an instance of the given type.
 
+        The result is cached by the type of the value for classes using the default instance check. Checks
+        against classes whose metaclass customizes it, such as abstract base classes that accept virtual
+        subclasses registered later, are never cached.
+
         Args:
             value (Any): The value to check.
             type_ (Union[type, tuple[type, ...]]): The type to check against.
@@ -2894,7 +4308,41 @@ class DataIdentificationUtils:
             bool: True if the value is an instance of the given type, False otherwise.
         """
 
-        return isinstance(value, type_)
+        # Key the result by the type of the value, which determines it for regular classes
+        key: tuple[type, Any] = (
+            type(value),
+            type_,
+        )
+
+        # Look up the cached result of the check
+        result: Optional[bool] = _ISINSTANCE_CACHE.get(key)
+
+        # Check if the result has been cached
+        if result is not None:
+            # Return the cached result
+            return result
+
+        # Check if the value is an instance of the type
+        result = isinstance(
+            value,
+            type_,
+        )
+
+        # Check if the instance check could change for the same type of value
+        if not cls._has_default_instance_check(type_=type_):
+            # Return the result of the check without caching it
+            return result
+
+        # Check if the cache is full
+        if len(_ISINSTANCE_CACHE) >= _ISINSTANCE_CACHE_SIZE:
+            # Drop all cached results instead of tracking their age
+            _ISINSTANCE_CACHE.clear()
+
+        # Cache the result of the check
+        _ISINSTANCE_CACHE[key] = result
+
+        # Return the result of the check
+        return result
 
     @classmethod
     def is_int(
@@ -2904,6 +4352,8 @@ class DataIdentificationUtils:
         """
         Checks if the value is an integer.
 
+        Booleans are not considered integers, although bool is a subclass of int.
+
         Args:
             value (Any): The value to check.
 
@@ -2911,10 +4361,16 @@ class DataIdentificationUtils:
             bool: True if the value is an integer, False otherwise.
         """
 
-        # Check if the value is an instance of int
-        return cls.is_instance(
-            type_=int,
-            value=value,
+        # Check if the value is exactly of type int before falling back to an instance check that excludes booleans
+        return type(value) is int or (
+            isinstance(
+                value,
+                int,
+            )
+            and not isinstance(
+                value,
+                bool,
+            )
         )
 
     @classmethod
@@ -2932,10 +4388,10 @@ class DataIdentificationUtils:
             bool: True if the value is a list, False otherwise.
         """
 
-        # Check if the value is an instance of list
-        return cls.is_instance(
-            type_=list,
-            value=value,
+        # Check if the value is exactly of type list before falling back to an instance check
+        return type(value) is list or isinstance(
+            value,
+            list,
         )
 
     @classmethod
@@ -2971,10 +4427,10 @@ class DataIdentificationUtils:
             bool: True if the value is a path, False otherwise.
         """
 
-        # Check if the value is an instance of Path
-        return cls.is_instance(
-            type_=Path,
-            value=value,
+        # Check if the value is exactly of the concrete path type of this platform before falling back to an instance check
+        return type(value) is _PATH_TYPE or isinstance(
+            value,
+            Path,
         )
 
     @classmethod
@@ -2995,14 +4451,10 @@ class DataIdentificationUtils:
             bool: True if the value is a primitive type, False otherwise.
         """
 
-        # Check if the value is an instance of a primitive type
-        return cls.is_instance(
-            type_=(
-                int,
-                float,
-                bool,
-            ),
-            value=value,
+        # Check if the value is exactly of a primitive type before falling back to an instance check
+        return type(value) in _PRIMITIVE_TYPES or isinstance(
+            value,
+            _PRIMITIVE_TYPES,
         )
 
     @classmethod
@@ -3020,10 +4472,10 @@ class DataIdentificationUtils:
             bool: True if the value is a set, False otherwise.
         """
 
-        # Check if the value is an instance of set
-        return cls.is_instance(
-            type_=set,
-            value=value,
+        # Check if the value is exactly of type set before falling back to an instance check
+        return type(value) is set or isinstance(
+            value,
+            set,
         )
 
     @classmethod
@@ -3041,10 +4493,10 @@ class DataIdentificationUtils:
             bool: True if the value is a string, False otherwise.
         """
 
-        # Check if the value is an instance of str
-        return cls.is_instance(
-            type_=str,
-            value=value,
+        # Check if the value is exactly of type str before falling back to an instance check
+        return type(value) is str or isinstance(
+            value,
+            str,
         )
 
     @classmethod
@@ -3062,10 +4514,10 @@ class DataIdentificationUtils:
             bool: True if the value is a time, False otherwise.
         """
 
-        # Check if the value is an instance of time
-        return cls.is_instance(
-            type_=time,
-            value=value,
+        # Check if the value is exactly of type time before falling back to an instance check
+        return type(value) is time or isinstance(
+            value,
+            time,
         )
 
     @classmethod
@@ -3083,10 +4535,10 @@ class DataIdentificationUtils:
             bool: True if the value is a timedelta, False otherwise.
         """
 
-        # Check if the value is an instance of timedelta
-        return cls.is_instance(
-            type_=timedelta,
-            value=value,
+        # Check if the value is exactly of type timedelta before falling back to an instance check
+        return type(value) is timedelta or isinstance(
+            value,
+            timedelta,
         )
 
     @classmethod
@@ -3104,10 +4556,10 @@ class DataIdentificationUtils:
             bool: True if the value is a timezone, False otherwise.
         """
 
-        # Check if the value is an instance of timezone
-        return cls.is_instance(
-            type_=timezone,
-            value=value,
+        # Check if the value is exactly of type timezone before falling back to an instance check
+        return type(value) is timezone or isinstance(
+            value,
+            timezone,
         )
 
     @classmethod
@@ -3125,10 +4577,10 @@ class DataIdentificationUtils:
             bool: True if the value is a tuple, False otherwise.
         """
 
-        # Check if the value is an instance of tuple
-        return cls.is_instance(
-            type_=tuple,
-            value=value,
+        # Check if the value is exactly of type tuple before falling back to an instance check
+        return type(value) is tuple or isinstance(
+            value,
+            tuple,
         )
 
     @classmethod
@@ -3146,8 +4598,182 @@ class DataIdentificationUtils:
             bool: True if the value is a UUID, False otherwise.
         """
 
-        # Check if the value is an instance of UUID
-        return cls.is_instance(
-            type_=UUID,
-            value=value,
+        # Check if the value is exactly of type UUID before falling back to an instance check
+        return type(value) is UUID or isinstance(
+            value,
+            UUID,
+        )
+
+    @classmethod
+    def warmup(cls) -> None:
+        """
+        Run representative strings through the identification and conversion paths once.
+
+        This moves one-time costs out of the first production calls: the lazy import of the strptime
+        machinery, the first use of the numpy string routines and the specialization of the hot bytecode.
+        The few warm-up strings stay in the caches.
+
+        Returns:
+            None
+        """
+
+        # Iterate over the strings encoding each recognized type
+        for value in _WARMUP_VALUES:
+            # Identify the type of the string
+            cls.identify_in_str(value=value)
+
+            # Identify the numeric type of the string
+            cls.identify_numeric_type(value=value)
+
+            # Iterate over the predicates checking strings
+            for could_be in (
+                cls.could_be_bool,
+                cls.could_be_complex,
+                cls.could_be_date,
+                cls.could_be_datetime,
+                cls.could_be_decimal,
+                cls.could_be_dict,
+                cls.could_be_float,
+                cls.could_be_fraction,
+                cls.could_be_int,
+                cls.could_be_list,
+                cls.could_be_set,
+                cls.could_be_time,
+                cls.could_be_timedelta,
+                cls.could_be_tuple,
+                cls.could_be_uuid,
+            ):
+                # Check the string with the predicate
+                could_be(value=value)
+
+            # Convert the string to the type it encodes
+            DataConversionUtils.str_to_auto(value=value)
+
+        # Deserialize the strings nested in a JSON document
+        DataConversionUtils.deserialize(
+            value=DataConversionUtils.serialize(value=list(_WARMUP_VALUES))
+        )
+
+        # Parse a string with an explicit format, which imports the strptime machinery on first use
+        DataConversionUtils.str_to_datetime(
+            format="%Y-%m-%d %H:%M:%S",
+            value="2020-01-01 12:00:00",
         )
+
+        # Check if numpy is available
+        if NUMPY_AVAILABLE:
+            # Identify the strings as an array
+            cls.identify_in_str_array(values=_WARMUP_VALUES)
+
+            # Check the strings as arrays
+            cls.could_be_float_array(values=_WARMUP_VALUES)
+            cls.could_be_int_array(values=_WARMUP_VALUES)
+            cls.could_be_uuid_array(values=_WARMUP_VALUES)
+
+
+# Converters keyed by the exact type of the value they convert in 'convert_to_str', called positionally
+_CONVERT_DISPATCH: Final[dict[type, Callable[..., Optional[str]]]] = {
+    bool: str,
+    bytes: DataConversionUtils.bytes_to_str,
+    complex: DataConversionUtils.complex_to_str,
+    date: DataConversionUtils.date_to_str,
+    datetime: DataConversionUtils.datetime_to_str,
+    Decimal: DataConversionUtils.decimal_to_str,
+    float: str,
+    int: str,
+    _PATH_TYPE: DataConversionUtils.path_to_str,
+    str: str,
+    time: DataConversionUtils.time_to_str,
+    timedelta: DataConversionUtils.timedelta_to_str,
+    _TIMEZONE_TYPE: DataConversionUtils.timezone_to_str,
+    UUID: DataConversionUtils.uuid_to_str,
+}
+
+# Format-aware converters keyed by the exact type of the value they convert in 'convert_to_str'
+_CONVERT_FORMAT_DISPATCH: Final[dict[type, Callable[..., str]]] = {
+    Counter: DataConversionUtils.counter_to_str,
+    defaultdict: DataConversionUtils.defaultdict_to_str,
+    deque: DataConversionUtils.deque_to_str,
+    dict: DataConversionUtils.dict_to_str,
+    frozendict: DataConversionUtils.frozendict_to_str,
+    frozenset: DataConversionUtils.frozenset_to_str,
+    list: DataConversionUtils.list_to_str,
+    set: DataConversionUtils.set_to_str,
+    tuple: DataConversionUtils.list_to_str,
+}
+
+# Leaf converters keyed by the exact type of the value they convert in 'serialize'
+_SERIALIZE_DISPATCH: Final[dict[type, Callable[..., Optional[str]]]] = {
+    bytes: DataConversionUtils.bytes_to_str,
+    complex: DataConversionUtils.complex_to_str,
+    date: DataConversionUtils.date_to_str,
+    datetime: DataConversionUtils.datetime_to_str,
+    _PATH_TYPE: DataConversionUtils.path_to_str,
+    time: DataConversionUtils.time_to_str,
+    timedelta: DataConversionUtils.timedelta_to_str,
+    _TIMEZONE_TYPE: DataConversionUtils.timezone_to_str,
+    UUID: DataConversionUtils.uuid_to_str,
+}
+
+# String converters keyed by the names of the groups of '_DESERIALIZE_RE' and '_AUTO_RE'
+_DESERIALIZE_DISPATCH: Final[dict[str, Callable[..., Any]]] = {
+    "bool": DataConversionUtils._str_to_bool_unchecked,
+    "complex": DataConversionUtils._str_to_complex_unchecked,
+    "date": DataConversionUtils._str_to_date_unchecked,
+    "datetime": DataConversionUtils._str_to_datetime_unchecked,
+    "decimal": DataConversionUtils._str_to_decimal_unchecked,
+    "fraction": DataConversionUtils._str_to_fraction_unchecked,
+    "int": DataConversionUtils._str_to_int_unchecked,
+    "time": DataConversionUtils._str_to_time_unchecked,
+    "timedelta": DataConversionUtils._str_to_timedelta_unchecked,
+    "uuid": DataConversionUtils._str_to_uuid_unchecked,
+}
+
+# Container types and their string converters keyed by the character their strings start with, tried in order
+_CONTAINER_DISPATCH: Final[dict[str, tuple[tuple[type, Callable[..., Any]], ...]]] = {
+    "(": ((tuple, DataConversionUtils.str_to_tuple),),
+    "[": ((list, DataConversionUtils.str_to_list),),
+    "{": (
+        (dict, DataConversionUtils.str_to_dict),
+        (set, DataConversionUtils.str_to_set),
+    ),
+}
+
+# Scalar types, their string converters and the characters other than digits and whitespace their strings can start with (None for any), tried in order by 'identify_in_str' when the single pass fails
+_IDENTIFY_FALLBACK: Final[
+    tuple[tuple[type, Callable[..., Any], Optional[frozenset[str]]], ...]
+] = (
+    (int, DataConversionUtils.str_to_int, frozenset("+-")),
+    (float, DataConversionUtils.str_to_float, frozenset("+-.IiNn")),
+    (complex, DataConversionUtils.str_to_complex, frozenset("(+-.IiNnJj")),
+    (date, DataConversionUtils.str_to_date, frozenset()),
+    (datetime, DataConversionUtils.str_to_datetime, frozenset()),
+    (time, DataConversionUtils.str_to_time, frozenset("T")),
+    (timedelta, DataConversionUtils.str_to_timedelta, frozenset("+-P")),
+    (UUID, DataConversionUtils.str_to_uuid, None),
+)
+
+# Types and string converters keyed by the names of the groups of '_IDENTIFY_RE', the converter being None where every match converts
+_IDENTIFY_DISPATCH: Final[dict[str, tuple[type, Optional[Callable[..., Any]]]]] = {
+    "bool": (bool, None),
+    "complex": (complex, None),
+    "date": (date, DataConversionUtils._str_to_date_unchecked),
+    "datetime": (datetime, DataConversionUtils._str_to_datetime_unchecked),
+    "float": (float, None),
+    "int": (int, DataConversionUtils._str_to_int_unchecked),
+    "time": (time, DataConversionUtils._str_to_time_unchecked),
+    "timedelta": (timedelta, DataConversionUtils._str_to_timedelta_unchecked),
+    "uuid": (UUID, None),
+}
+
+# Mapping types 'serialize' hands to the JSON encoder as dictionaries when it cannot encode them natively
+_SERIALIZE_MAPPING_TYPES: Final[frozenset[type]] = frozenset({frozendict})
+
+# Sequence types 'serialize' hands to the JSON encoder as lists
+_SERIALIZE_SEQUENCE_TYPES: Final[frozenset[type]] = frozenset(
+    {
+        deque,
+        frozenset,
+        set,
+    }
+)
@@ -30,11 +30,29 @@ class DataConversionError(Exception):
             None
         """
 
-        # Use the type name if target is a type, otherwise use the string representation
+        # Pass the value and target on unformatted, so exceptions that are caught and discarded never build their message
         super().__init__(
-            f"Failed to convert {value} to {type_ if isinstance(type_, str) else type_.__name__}"
+            value,
+            type_,
         )
 
+        # Store the value that failed to convert
+        self.value: Any = value
+
+        # Store the target type of the conversion
+        self.type_: Union[str, type] = type_
+
+    def __str__(self) -> str:
+        """
+        Build the message of the exception when it is first displayed.
+
+        Returns:
+            str: The message naming the value and the target type.
+        """
+
+        # Use the type name if target is a type, otherwise use the string representation
+        return f"Failed to convert {self.value} to {self.type_ if isinstance(self.type_, str) else self.type_.__name__}"
+
 
 class DataIdentificationError(Exception):
     """
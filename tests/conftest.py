@@ -0,0 +1,58 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-15
+"""
+
+from typing import Iterator
+
+import pytest
+
+from datautils.core import core
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(
+            True,
+            id="orjson",
+        ),
+        pytest.param(
+            False,
+            id="json",
+        ),
+    ]
+)
+def json_backend(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[bool]:
+    """
+    Run a test once with orjson decoding JSON documents and once with the standard library.
+
+    Args:
+        request (pytest.FixtureRequest): The request holding whether orjson is used.
+        monkeypatch (pytest.MonkeyPatch): The fixture used to switch the backend.
+
+    Yields:
+        bool: Whether orjson decodes the JSON documents.
+    """
+
+    # Check if the test should use orjson but orjson is not installed
+    if request.param and not core.ORJSON_AVAILABLE:
+        # Skip the test, as the orjson backend cannot be exercised
+        pytest.skip("orjson is not installed")
+
+    # Switch the backend used to decode JSON documents
+    monkeypatch.setattr(
+        core,
+        "ORJSON_AVAILABLE",
+        request.param,
+    )
+
+    # Clear the caches, so that no result computed with the other backend is reused
+    core.DataConversionUtils.clear_caches()
+
+    yield request.param
+
+    # Clear the caches, so that no result computed with this backend leaks into other tests
+    core.DataConversionUtils.clear_caches()
@@ -0,0 +1,680 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-15
+"""
+
+import json
+import math
+import sys
+from collections import Counter, defaultdict, deque
+from datetime import date, timedelta
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from datautils import DataConversionUtils
+from datautils.core import core
+
+# Mixed values the array conversions have to convert exactly like their scalar counterparts
+MIXED_VALUES: list[Any] = [
+    "1",
+    "-1",
+    "+1",
+    "--1",
+    "1.5",
+    "1e5",
+    " 1 ",
+    "1_000",
+    "\u0661\u0662",
+    "1\x00",
+    "\x00",
+    "",
+    "abc",
+    "nan",
+    "-inf",
+    5,
+    1.5,
+    None,
+    True,
+    b"1",
+]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "[18446744073709551616]",
+        "[-9223372036854775809]",
+        '{"a": 123456789012345678901234567890}',
+        "[1, 2.5, null, true]",
+        '"\\ud800"',
+    ],
+)
+def test_deserialize_decodes_like_json(
+    json_backend: bool,
+    value: str,
+) -> None:
+    """
+    Test that 'deserialize' decodes JSON documents exactly like the standard library with either backend.
+    """
+
+    assert DataConversionUtils.deserialize(value=value) == json.loads(value)
+
+
+def test_deserialize_decodes_non_finite_floats(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'deserialize' decodes NaN and infinity with either backend.
+    """
+
+    (
+        nan,
+        positive,
+        negative,
+    ) = DataConversionUtils.deserialize(value="[NaN, Infinity, -Infinity]")
+
+    assert math.isnan(nan)
+    assert positive == math.inf
+    assert negative == -math.inf
+
+
+def test_deserialize_rejects_invalid_json(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'deserialize' raises a ValueError for invalid JSON with either backend.
+    """
+
+    with pytest.raises(ValueError):
+        DataConversionUtils.deserialize(value="[1,")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "[123456789012345678901234567890]",
+        "[18446744073709551616, -9223372036854775809]",
+        '["\\ud800"]',
+    ],
+)
+def test_str_to_list_decodes_like_json(
+    json_backend: bool,
+    value: str,
+) -> None:
+    """
+    Test that 'str_to_list' decodes lists exactly like the standard library with either backend.
+    """
+
+    assert DataConversionUtils.str_to_list(value=value) == json.loads(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        '{"a": 123456789012345678901234567890}',
+        '{"a": -9223372036854775809}',
+    ],
+)
+def test_str_to_dict_decodes_like_json(
+    json_backend: bool,
+    value: str,
+) -> None:
+    """
+    Test that 'str_to_dict' decodes dictionaries exactly like the standard library with either backend.
+    """
+
+    assert DataConversionUtils.str_to_dict(value=value) == json.loads(value)
+
+
+def test_str_to_list_decodes_non_finite_floats(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'str_to_list' decodes NaN and infinity instead of returning None with either backend.
+    """
+
+    (
+        nan,
+        positive,
+    ) = DataConversionUtils.str_to_list(value="[NaN, Infinity]")
+
+    assert math.isnan(nan)
+    assert positive == math.inf
+    assert math.isnan(DataConversionUtils.str_to_dict(value='{"a": NaN}')["a"])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        math.inf,
+        -math.inf,
+        2**70,
+        -(2**70),
+        Decimal("1.5"),
+        Decimal("-0.001"),
+    ],
+)
+def test_serialize_round_trips_numbers(
+    json_backend: bool,
+    value: Any,
+) -> None:
+    """
+    Test that 'deserialize' restores the numbers in the output of 'serialize' with either backend.
+    """
+
+    result: Any = DataConversionUtils.deserialize(
+        value=DataConversionUtils.serialize(
+            value={
+                "a": value,
+                "b": [value],
+            }
+        )
+    )
+
+    assert result == {
+        "a": value,
+        "b": [value],
+    }
+    assert type(result["a"]) is type(value)
+    assert type(result["b"][0]) is type(value)
+
+
+def test_serialize_round_trips_nan(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'deserialize' restores NaN in the output of 'serialize' with either backend.
+    """
+
+    assert math.isnan(
+        DataConversionUtils.deserialize(
+            value=DataConversionUtils.serialize(value={"a": math.nan})
+        )["a"]
+    )
+    assert math.isnan(
+        DataConversionUtils.deserialize(
+            value=DataConversionUtils.serialize(value=[math.nan])
+        )[0]
+    )
+
+
+def test_deserialize_keeps_strings_that_are_not_canonical_numbers(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'deserialize' leaves strings holding booleans or non-canonical integers unchanged.
+    """
+
+    assert DataConversionUtils.deserialize(
+        value='{"zip": "01234", "flag": "true", "signed": "+5", "zero": "-0"}'
+    ) == {
+        "zip": "01234",
+        "flag": "true",
+        "signed": "+5",
+        "zero": "-0",
+    }
+
+
+def test_deserialize_restores_canonical_integers(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'deserialize' restores strings holding integers written the way 'str' writes them.
+    """
+
+    assert DataConversionUtils.deserialize(value='["0", "1234", "-12"]') == [
+        0,
+        1234,
+        -12,
+    ]
+
+
+def test_str_to_auto_still_converts_booleans_and_integers() -> None:
+    """
+    Test that 'str_to_auto' keeps converting every boolean and integer spelling.
+    """
+
+    assert DataConversionUtils.str_to_auto(value="true") == (
+        bool,
+        True,
+    )
+    assert DataConversionUtils.str_to_auto(value="01234") == (
+        int,
+        1234,
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "str_to_float",
+        "str_to_int",
+    ],
+)
+@pytest.mark.parametrize(
+    "values",
+    [
+        MIXED_VALUES,
+        ["1", "2\x00"],
+        [1, 2],
+        ["1", "2"],
+    ],
+)
+def test_array_conversions_match_scalar_conversions(
+    name: str,
+    values: list[Any],
+) -> None:
+    """
+    Test that each array conversion converts every value exactly like its scalar counterpart.
+    """
+
+    pytest.importorskip("numpy")
+
+    (
+        result,
+        mask,
+    ) = getattr(
+        DataConversionUtils,
+        f"{name}_array",
+    )(values)
+
+    for (
+        value,
+        item,
+        valid,
+    ) in zip(
+        values,
+        result,
+        mask,
+    ):
+        expected: Any = getattr(
+            DataConversionUtils,
+            name,
+        )(value=value)
+
+        assert valid == (expected is not None)
+
+        if valid:
+            assert item == expected or (math.isnan(item) and math.isnan(expected))
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "str_to_float_array",
+        "str_to_int_array",
+    ],
+)
+def test_array_conversions_require_numpy(
+    name: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the array conversions raise an ImportError when numpy is not installed.
+    """
+
+    monkeypatch.setattr(
+        core,
+        "NUMPY_AVAILABLE",
+        False,
+    )
+
+    with pytest.raises(ImportError):
+        getattr(
+            DataConversionUtils,
+            name,
+        )(["1"])
+
+
+def test_convert_to_str_uses_the_dedicated_converters() -> None:
+    """
+    Test that 'convert_to_str' converts bytes, tuples, frozensets and deques with their converters.
+    """
+
+    assert DataConversionUtils.convert_to_str(value=b"ab") == "ab"
+    assert DataConversionUtils.convert_to_str(value=(1, 2)) == "1, 2"
+    assert DataConversionUtils.convert_to_str(value=frozenset([1])) == "1"
+    assert DataConversionUtils.convert_to_str(value=deque([1, 2])) == "1, 2"
+
+
+def test_simple_formats_list_key_value_pairs() -> None:
+    """
+    Test that the "simple" formats of 'dict_to_str' and 'counter_to_str' list 'key=value' pairs.
+    """
+
+    assert (
+        DataConversionUtils.dict_to_str(
+            value={
+                "a": 1,
+                "b": 2,
+            },
+            format="simple",
+        )
+        == "a=1, b=2"
+    )
+    assert (
+        DataConversionUtils.counter_to_str(
+            value=Counter("aab"),
+            format="simple",
+        )
+        == "a=2, b=1"
+    )
+
+
+def test_str_to_date_accepts_a_format() -> None:
+    """
+    Test that 'str_to_date' parses strings in an explicit format.
+    """
+
+    assert DataConversionUtils.str_to_date(
+        value="2020/01/02",
+        format="%Y/%m/%d",
+    ) == date(2020, 1, 2)
+
+
+@pytest.mark.parametrize(
+    (
+        "value",
+        "expected",
+    ),
+    [
+        ("true", True),
+        ("YES", True),
+        ("1", True),
+        ("t", True),
+        ("false", False),
+        ("No", False),
+        ("0", False),
+        ("maybe", None),
+        (1, None),
+    ],
+)
+def test_str_to_bool(
+    value: Any,
+    expected: Any,
+) -> None:
+    """
+    Test that 'str_to_bool' maps its vocabulary case-insensitively and rejects everything else.
+    """
+
+    assert DataConversionUtils.str_to_bool(value=value) is expected
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "str_to_complex",
+        "str_to_date",
+        "str_to_datetime",
+        "str_to_decimal",
+        "str_to_float",
+        "str_to_fraction",
+        "str_to_int",
+        "str_to_time",
+        "str_to_timedelta",
+        "str_to_uuid",
+    ],
+)
+def test_str_to_converters_reject_non_strings(
+    name: str,
+) -> None:
+    """
+    Test that the 'str_to_*' converters return None for values that are not strings.
+    """
+
+    assert (
+        getattr(
+            DataConversionUtils,
+            name,
+        )(value=5)
+        is None
+    )
+
+
+def test_str_to_fraction_rejects_zero_denominators() -> None:
+    """
+    Test that 'str_to_fraction' and 'deserialize' handle fractions with a zero denominator.
+    """
+
+    assert DataConversionUtils.str_to_fraction(value="1/0") is None
+    assert DataConversionUtils.str_to_fraction(value="1/3") == Fraction(1, 3)
+    assert DataConversionUtils.deserialize(value='"1/0"') == "1/0"
+
+
+def test_str_to_int_respects_the_int_digit_limit() -> None:
+    """
+    Test that 'str_to_int' returns None instead of raising for digit strings 'int' refuses.
+    """
+
+    limit: int = getattr(
+        sys,
+        "get_int_max_str_digits",
+        lambda: 0,
+    )()
+
+    if not limit:
+        pytest.skip("int has no digit limit on this Python version")
+
+    assert DataConversionUtils.str_to_int(value="1" * limit) == int("1" * limit)
+    assert DataConversionUtils.str_to_int(value="1" * (limit + 1)) is None
+
+
+@pytest.mark.parametrize(
+    (
+        "value",
+        "expected",
+    ),
+    [
+        ("1:02:03", timedelta(hours=1, minutes=2, seconds=3)),
+        ("2,01:02:03", timedelta(days=2, hours=1, minutes=2, seconds=3)),
+        ("P1D", timedelta(days=1)),
+        ("P99999999999999D", None),
+        ("soon", None),
+    ],
+)
+def test_str_to_timedelta(
+    value: str,
+    expected: Any,
+) -> None:
+    """
+    Test that 'str_to_timedelta' parses every supported format and rejects durations out of range.
+    """
+
+    if value.startswith("P") and not core.ISODATE_AVAILABLE:
+        pytest.skip("isodate is not installed")
+
+    assert DataConversionUtils.str_to_timedelta(value=value) == expected
+
+
+def test_deserialize_keeps_out_of_range_durations(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'deserialize' keeps ISO 8601 durations beyond the range of timedelta as strings.
+    """
+
+    assert (
+        DataConversionUtils.deserialize(value='"P99999999999999D"')
+        == "P99999999999999D"
+    )
+
+
+def test_str_to_uuid_rejects_short_strings() -> None:
+    """
+    Test that 'str_to_uuid' rejects strings too short to hold a UUID and accepts every UUID spelling.
+    """
+
+    expected: UUID = UUID("12345678-1234-5678-1234-567812345678")
+
+    assert DataConversionUtils.str_to_uuid(value="abc") is None
+    assert DataConversionUtils.str_to_uuid(value=str(expected)) == expected
+    assert DataConversionUtils.str_to_uuid(value=expected.hex) == expected
+    assert DataConversionUtils.str_to_uuid(value=f"{{{expected}}}") == expected
+
+
+def test_str_to_set_and_tuple_parse_literals() -> None:
+    """
+    Test that 'str_to_set' and 'str_to_tuple' parse Python literals and reject other strings.
+    """
+
+    assert DataConversionUtils.str_to_set(value="{1, 'a,b'}") == {1, "a,b"}
+    assert DataConversionUtils.str_to_tuple(value="(1, (2, 3))") == (1, (2, 3))
+    assert DataConversionUtils.str_to_set(value="[1]") is None
+    assert DataConversionUtils.str_to_tuple(value="[1]") is None
+
+
+def test_str_to_path_does_not_touch_the_filesystem(
+    tmp_path: Path,
+) -> None:
+    """
+    Test that 'str_to_path' keeps relative paths and only checks existence when asked to.
+    """
+
+    assert DataConversionUtils.str_to_path(value="relative/x") == Path("relative/x")
+    assert (
+        DataConversionUtils.str_to_path(
+            value=str(tmp_path / "missing"),
+            check_exists=True,
+        )
+        is None
+    )
+    assert (
+        DataConversionUtils.str_to_path(
+            value=str(tmp_path),
+            check_exists=True,
+        )
+        == tmp_path
+    )
+
+
+def test_str_to_defaultdict_and_deque(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'str_to_defaultdict' and 'str_to_deque' convert JSON and reject the wrong containers.
+    """
+
+    result: Any = DataConversionUtils.str_to_defaultdict(value='{"a": 1}')
+
+    assert type(result) is defaultdict
+    assert result == {"a": 1}
+    assert DataConversionUtils.str_to_defaultdict(value="[1]") is None
+    assert DataConversionUtils.str_to_deque(value="[1, 2]") == deque([1, 2])
+    assert DataConversionUtils.str_to_deque(value="{}") is None
+
+
+def test_serialize_writes_json_values() -> None:
+    """
+    Test that 'serialize' writes numbers, booleans and None as JSON values and tuples as arrays.
+    """
+
+    assert json.loads(
+        DataConversionUtils.serialize(
+            value={
+                "a": (1, 2),
+                "b": True,
+                "c": None,
+                "d": 1.5,
+            }
+        )
+    ) == {
+        "a": [1, 2],
+        "b": True,
+        "c": None,
+        "d": 1.5,
+    }
+
+
+def test_deserialize_restores_nested_strings(
+    json_backend: bool,
+) -> None:
+    """
+    Test that 'deserialize' restores strings at any depth and returns top-level scalars.
+    """
+
+    assert DataConversionUtils.deserialize(
+        value='{"a": [{"b": ["2020-01-02", "1/3"]}], "c": "x"}'
+    ) == {
+        "a": [{"b": [date(2020, 1, 2), Fraction(1, 3)]}],
+        "c": "x",
+    }
+    assert DataConversionUtils.deserialize(value="5") == 5
+    assert DataConversionUtils.deserialize(value="null") is None
+
+
+def test_deserialize_typed() -> None:
+    """
+    Test that 'deserialize_typed' decodes into the schema and raises DataConversionError otherwise.
+    """
+
+    pytest.importorskip("msgspec")
+
+    assert DataConversionUtils.deserialize_typed(
+        value="[1, 2]",
+        schema=list[int],
+    ) == [1, 2]
+
+    with pytest.raises(core.DataConversionError):
+        DataConversionUtils.deserialize_typed(
+            value='["a"]',
+            schema=list[int],
+        )
+
+
+def test_deserialize_typed_requires_msgspec(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that 'deserialize_typed' raises an ImportError when msgspec is not installed.
+    """
+
+    monkeypatch.setattr(
+        core,
+        "MSGSPEC_AVAILABLE",
+        False,
+    )
+
+    with pytest.raises(ImportError):
+        DataConversionUtils.deserialize_typed(
+            value="[1]",
+            schema=list[int],
+        )
+
+
+def test_str_to_auto() -> None:
+    """
+    Test that 'str_to_auto' returns the identified type with the converted value.
+    """
+
+    assert DataConversionUtils.str_to_auto(value="[1, 2]") == (
+        list,
+        [1, 2],
+    )
+    assert DataConversionUtils.str_to_auto(value="1.5") == (
+        Decimal,
+        Decimal("1.5"),
+    )
+    assert DataConversionUtils.str_to_auto(value="hello") == (
+        str,
+        "hello",
+    )
+
+
+def test_clear_caches_forgets_repeated_conversions() -> None:
+    """
+    Test that 'clear_caches' empties the caches filled by repeated conversions and identifications.
+    """
+
+    DataConversionUtils.str_to_int(value="12")
+    core.DataIdentificationUtils.identify_in_str(value="12")
+
+    DataConversionUtils.clear_caches()
+
+    assert not core._IDENTIFY_CACHE
+    assert not core._COULD_BE_CACHE
+    assert not core._ISINSTANCE_CACHE
@@ -0,0 +1,49 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-15
+"""
+
+from datautils.core.exceptions import DataConversionError
+
+
+def test_data_conversion_error_exposes_its_value_and_type() -> None:
+    """
+    Test that 'DataConversionError' exposes the value and target type as attributes and in 'args'.
+    """
+
+    error: DataConversionError = DataConversionError(
+        value="x",
+        type_=int,
+    )
+
+    assert error.value == "x"
+    assert error.type_ is int
+    assert error.args == (
+        "x",
+        int,
+    )
+
+
+def test_data_conversion_error_message() -> None:
+    """
+    Test that 'DataConversionError' names the value and the target type in its message.
+    """
+
+    assert (
+        str(
+            DataConversionError(
+                value="x",
+                type_=int,
+            )
+        )
+        == "Failed to convert x to int"
+    )
+    assert (
+        str(
+            DataConversionError(
+                value="x",
+                type_="schema",
+            )
+        )
+        == "Failed to convert x to schema"
+    )
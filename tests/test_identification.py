@@ -0,0 +1,490 @@
+"""
+Author: Louis Goodnews
+Date: 2025-09-15
+"""
+
+import math
+import sys
+from abc import ABC
+from datetime import date, timedelta
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Iterator
+from uuid import UUID
+
+import pytest
+
+from datautils import DataIdentificationUtils
+from datautils.core import core
+
+# Mixed values the array checks have to judge exactly like their scalar counterparts
+MIXED_VALUES: list[Any] = [
+    "1",
+    "-1",
+    "+1",
+    "--1",
+    "1.5",
+    ".5",
+    "5.",
+    "1e5",
+    " 1 ",
+    "1_000",
+    "\u0661\u0662",
+    "1\x00",
+    "\x00",
+    "1\x002",
+    "",
+    "abc",
+    "nan",
+    "inf",
+    "true",
+    "1" * 4300,
+    "1" * 4301,
+    "-" + "1" * 4301,
+    "12345678-1234-5678-1234-567812345678",
+    "12345678123456781234567812345678",
+    "{12345678-1234-5678-1234-567812345678}",
+    "12345678-1234-5678-1234-567812345678\x00",
+    5,
+    1.5,
+    None,
+    True,
+    UUID("12345678-1234-5678-1234-567812345678"),
+    b"1",
+    2j,
+]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "[NaN]",
+        "[Infinity, -Infinity]",
+        "[123456789012345678901234567890]",
+        '["\\ud800"]',
+    ],
+)
+def test_could_be_list_accepts_what_json_decodes(
+    json_backend: bool,
+    value: str,
+) -> None:
+    """
+    Test that 'could_be_list' accepts every list the standard library decodes with either backend.
+    """
+
+    assert DataIdentificationUtils.could_be_list(value=value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        '{"a": NaN}',
+        '{"a": 123456789012345678901234567890}',
+    ],
+)
+def test_could_be_dict_accepts_what_json_decodes(
+    json_backend: bool,
+    value: str,
+) -> None:
+    """
+    Test that 'could_be_dict' accepts every dictionary the standard library decodes with either backend.
+    """
+
+    assert DataIdentificationUtils.could_be_dict(value=value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "[1,",
+        "[NaN",
+        "{'a': 1}",
+    ],
+)
+def test_could_be_list_and_dict_reject_invalid_json(
+    json_backend: bool,
+    value: str,
+) -> None:
+    """
+    Test that 'could_be_list' and 'could_be_dict' reject invalid JSON with either backend.
+    """
+
+    assert not DataIdentificationUtils.could_be_list(value=value)
+    assert not DataIdentificationUtils.could_be_dict(value=value)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "could_be_float",
+        "could_be_int",
+        "could_be_uuid",
+        "identify_in_str",
+    ],
+)
+def test_array_checks_match_scalar_checks(
+    name: str,
+) -> None:
+    """
+    Test that each array check judges every value exactly like its scalar counterpart.
+    """
+
+    pytest.importorskip("numpy")
+
+    scalar: Any = getattr(
+        DataIdentificationUtils,
+        name,
+    )
+
+    assert list(
+        getattr(
+            DataIdentificationUtils,
+            f"{name}_array",
+        )(MIXED_VALUES)
+    ) == [scalar(value=value) for value in MIXED_VALUES]
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "could_be_float_array",
+        "could_be_int_array",
+        "could_be_uuid_array",
+        "identify_in_str_array",
+    ],
+)
+def test_array_checks_require_numpy(
+    name: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the array checks raise an ImportError when numpy is not installed.
+    """
+
+    monkeypatch.setattr(
+        core,
+        "NUMPY_AVAILABLE",
+        False,
+    )
+
+    with pytest.raises(ImportError):
+        getattr(
+            DataIdentificationUtils,
+            name,
+        )(["1"])
+
+
+def test_is_instance_sees_virtual_subclasses_registered_later() -> None:
+    """
+    Test that 'is_instance' reflects virtual subclasses registered after a first check.
+    """
+
+    class Base(ABC):
+        pass
+
+    class Registered:
+        pass
+
+    assert not DataIdentificationUtils.is_instance(
+        value=Registered(),
+        type_=Base,
+    )
+
+    Base.register(Registered)
+
+    assert DataIdentificationUtils.is_instance(
+        value=Registered(),
+        type_=Base,
+    )
+    assert DataIdentificationUtils.is_instance(
+        value=Registered(),
+        type_=(
+            int,
+            Base,
+        ),
+    )
+
+
+def test_is_instance_honours_custom_instance_checks() -> None:
+    """
+    Test that 'is_instance' defers to a custom '__instancecheck__' for every value.
+    """
+
+    class OneMeta(type):
+        def __instancecheck__(
+            cls,
+            instance: Any,
+        ) -> bool:
+            return instance == 1
+
+    class One(metaclass=OneMeta):
+        pass
+
+    assert DataIdentificationUtils.is_instance(
+        value=1,
+        type_=One,
+    )
+    assert not DataIdentificationUtils.is_instance(
+        value=2,
+        type_=One,
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        math.nan,
+        complex(math.nan, 0),
+        Decimal("NaN"),
+        Decimal("sNaN"),
+        Decimal("1.5"),
+        Fraction(1, 3),
+        10**400,
+        "x" * 1000,
+        b"x" * 1000,
+    ],
+    ids=[
+        "float-nan",
+        "complex-nan",
+        "decimal-nan",
+        "decimal-snan",
+        "decimal",
+        "fraction",
+        "large-int",
+        "long-str",
+        "long-bytes",
+    ],
+)
+def test_could_be_cache_skips_nan_and_large_values(
+    value: Any,
+) -> None:
+    """
+    Test that the 'could_be_*' checks do not cache NaN, decimals, fractions and large values.
+    """
+
+    core.DataConversionUtils.clear_caches()
+
+    DataIdentificationUtils._could_be_constructed(
+        type_=complex,
+        value=value,
+    )
+
+    assert not any(key[2] is value for key in core._COULD_BE_CACHE)
+
+
+def test_could_be_cache_keeps_small_values() -> None:
+    """
+    Test that the 'could_be_*' checks cache their results for small immutable values.
+    """
+
+    core.DataConversionUtils.clear_caches()
+
+    assert DataIdentificationUtils._could_be_constructed(
+        type_=complex,
+        value=2**40,
+    )
+    assert (complex, int, 2**40) in core._COULD_BE_CACHE
+
+
+@pytest.mark.parametrize(
+    (
+        "value",
+        "expected",
+    ),
+    [
+        ("1", int),
+        ("0", int),
+        (" 1 ", int),
+        ("1_000", int),
+        ("1.5", float),
+        ("inf", float),
+        ("1j", complex),
+        ("[]", list),
+        ("{}", dict),
+        ("()", tuple),
+        ("true", bool),
+        ("false", bool),
+        ("yes", bool),
+        ("n", bool),
+        ("2020-01-02", date),
+        ("1,02:03:04", timedelta),
+        ("12345678-1234-5678-1234-56781234abcd", UUID),
+        ("1234567812345678123456781234abcd", UUID),
+        ("{12345678-1234-5678-1234-56781234abcd}", UUID),
+        ("2020-13-01", Path),
+        ("hello", Path),
+        (5, None),
+    ],
+)
+def test_identify_in_str(
+    value: Any,
+    expected: Any,
+) -> None:
+    """
+    Test that 'identify_in_str' recognizes every spelling the 'str_to_*' converters accept.
+    """
+
+    assert DataIdentificationUtils.identify_in_str(value=value) is expected
+
+
+@pytest.mark.parametrize(
+    (
+        "value",
+        "expected",
+    ),
+    [
+        (1, int),
+        (True, int),
+        (1.5, float),
+        (Decimal("1"), Decimal),
+        ("1", int),
+        ("1.5", float),
+        ("1j", complex),
+        ("x", None),
+    ],
+)
+def test_identify_numeric_type(
+    value: Any,
+    expected: Any,
+) -> None:
+    """
+    Test that 'identify_numeric_type' returns the numeric type of numbers and numeric strings.
+    """
+
+    assert DataIdentificationUtils.identify_numeric_type(value=value) is expected
+
+
+def test_int_digit_limit_is_respected() -> None:
+    """
+    Test that digit strings beyond the int digit limit are not identified as integers, one by one or at once.
+    """
+
+    limit: int = getattr(
+        sys,
+        "get_int_max_str_digits",
+        lambda: 0,
+    )()
+
+    if not limit:
+        pytest.skip("int has no digit limit on this Python version")
+
+    values: list[str] = [
+        "1" * limit,
+        "1" * (limit + 1),
+        "-" + "1" * (limit + 1),
+    ]
+
+    assert [DataIdentificationUtils.could_be_int(value=value) for value in values] == [
+        True,
+        False,
+        False,
+    ]
+    assert [
+        DataIdentificationUtils.identify_numeric_type(value=value) for value in values
+    ] == [
+        int,
+        float,
+        float,
+    ]
+    assert [
+        DataIdentificationUtils.identify_in_str(value=value) for value in values
+    ] == [
+        int,
+        float,
+        float,
+    ]
+
+    if core.NUMPY_AVAILABLE:
+        assert list(DataIdentificationUtils.could_be_int_array(values)) == [
+            True,
+            False,
+            False,
+        ]
+        assert list(DataIdentificationUtils.identify_in_str_array(values)) == [
+            int,
+            float,
+            float,
+        ]
+
+
+def test_is_int_excludes_booleans() -> None:
+    """
+    Test that 'is_int' accepts integers but not booleans.
+    """
+
+    assert DataIdentificationUtils.is_int(value=1)
+    assert not DataIdentificationUtils.is_int(value=True)
+
+
+def test_identify_returns_the_type_name() -> None:
+    """
+    Test that 'identify' returns the name of the type of the value.
+    """
+
+    assert DataIdentificationUtils.identify(value=1) == "int"
+    assert DataIdentificationUtils.identify(value=Path("x")) == type(Path("x")).__name__
+
+
+def test_could_be_checks_return_false_for_rejected_types() -> None:
+    """
+    Test that the 'could_be_*' checks return False instead of raising when the constructor rejects the value.
+    """
+
+    assert not DataIdentificationUtils.could_be_int(value=object())
+    assert not DataIdentificationUtils.could_be_complex(value=[1])
+    assert not DataIdentificationUtils.could_be_bytes(value=1.5)
+
+
+def test_could_be_bool_semantics() -> None:
+    """
+    Test that 'could_be_bool' only accepts booleans, integers and the vocabulary of 'str_to_bool'.
+    """
+
+    assert DataIdentificationUtils.could_be_bool(value=True)
+    assert DataIdentificationUtils.could_be_bool(value=1)
+    assert DataIdentificationUtils.could_be_bool(value="yes")
+    assert not DataIdentificationUtils.could_be_bool(value="maybe")
+    assert not DataIdentificationUtils.could_be_bool(value=[])
+
+
+def test_could_be_fraction_and_uuid() -> None:
+    """
+    Test that 'could_be_fraction' and 'could_be_uuid' judge strings without constructing them.
+    """
+
+    assert DataIdentificationUtils.could_be_fraction(value="1/3")
+    assert not DataIdentificationUtils.could_be_fraction(value="1/0")
+    assert DataIdentificationUtils.could_be_uuid(
+        value="12345678-1234-5678-1234-567812345678"
+    )
+    assert not DataIdentificationUtils.could_be_uuid(
+        value="12345678-1234-5678-1234-56781234567g"
+    )
+
+
+def test_container_could_be_checks_do_not_consume_iterators() -> None:
+    """
+    Test that the container 'could_be_*' checks accept iterables without consuming them.
+    """
+
+    def numbers() -> Iterator[int]:
+        yield 1
+        yield 2
+
+    iterator: Iterator[int] = numbers()
+
+    assert DataIdentificationUtils.could_be_list(value=iterator)
+    assert list(iterator) == [1, 2]
+    assert DataIdentificationUtils.could_be_set(value=[1])
+    assert DataIdentificationUtils.could_be_frozendict(value={"a": 1})
+    assert not DataIdentificationUtils.could_be_tuple(value="[1]")
+
+
+def test_warmup() -> None:
+    """
+    Test that 'warmup' runs and leaves the checks working.
+    """
+
+    assert DataIdentificationUtils.warmup() is None
+    assert DataIdentificationUtils.identify_in_str(value="1") is int